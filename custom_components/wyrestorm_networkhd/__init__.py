@@ -107,7 +107,8 @@ def _register_services(hass: HomeAssistant) -> None:
         """Handle matrix set service call."""
         # Get first available coordinator (services are domain-wide)
         coordinator = next(iter(hass.data[DOMAIN].values()))
-        await coordinator.set_matrix(call.data[ATTR_SOURCE_DEVICE], call.data[ATTR_TARGET_DEVICE])
+        # Await the matrix refresh so the new routing is visible when the service call returns
+        await coordinator.set_matrix(call.data[ATTR_SOURCE_DEVICE], call.data[ATTR_TARGET_DEVICE], background=False)
 
     async def handle_power_control(call: ServiceCall) -> None:
         """Handle power control service call."""
@@ -25,40 +25,45 @@ def cache_for_seconds(seconds: int) -> Callable:
             return await self.api.expensive_call()
 
     Note:
-        - Cache is keyed by function name and arguments
+        - Results are stored on the instance, keyed by arguments, so they are
+          released together with the instance and never shared with a new one
         - Each decorated method has independent cache storage
-        - Use method.clear_cache() to manually invalidate cache
+        - Use method.clear_cache(instance) to manually invalidate an instance's cache
         - Memory usage scales with number of unique argument combinations
     """
 
     def decorator(func: Callable) -> Callable:
-        cache: dict[tuple, Any] = {}
-        cache_time: dict[tuple, float] = {}
+        # Per-instance storage attribute: {cache_key: (result, stored_at)}
+        cache_attr = f"_cache_{func.__name__}"
 
         @wraps(func)
         async def wrapper(self, *args, **kwargs):
-            # Create cache key from function name and args
-            cache_key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            cache: dict[tuple, tuple[Any, float]] | None = getattr(self, cache_attr, None)
+            if cache is None:
+                cache = {}
+                setattr(self, cache_attr, cache)
+
+            # Create cache key from args
+            cache_key = (args, tuple(sorted(kwargs.items())))
 
             # Check if we have a valid cached result
-            if cache_key in cache and cache_key in cache_time:
-                elapsed = time.time() - cache_time[cache_key]
-                if elapsed < seconds:
-                    return cache[cache_key]
+            cached = cache.get(cache_key)
+            if cached is not None and time.time() - cached[1] < seconds:
+                return cached[0]
 
             # Call the actual function
             result = await func(self, *args, **kwargs)
 
             # Store in cache
-            cache[cache_key] = result
-            cache_time[cache_key] = time.time()
+            cache[cache_key] = (result, time.time())
 
             return result
 
-        # Add method to clear cache if needed
-        def clear_cache() -> None:
-            cache.clear()
-            cache_time.clear()
+        # Add method to clear an instance's cache if needed
+        def clear_cache(instance: Any) -> None:
+            cache = getattr(instance, cache_attr, None)
+            if cache is not None:
+                cache.clear()
 
         wrapper.clear_cache = clear_cache  # type: ignore[attr-defined]
 
@@ -1,6 +1,7 @@
 """Utility functions for WyreStorm NetworkHD Coordinator."""
 
 import logging
+import sys
 from typing import Any
 
 try:
@@ -25,13 +26,17 @@ def build_device_collections(
     transmitters = {}
     receivers = {}
 
+    # Index status and info by device name once for O(1) lookups
+    status_by_name = {d.name: d for d in device_status_list}
+    info_by_name = {d.name: d for d in device_info_list}
+
     # Create device mapping by true name from device_json (primary source)
     for device_json in device_json_list:
         device_name = device_json.trueName
 
         # Find corresponding status and info
-        device_status = next((d for d in device_status_list if d.name == device_name), None)
-        device_info = next((d for d in device_info_list if d.name == device_name), None)
+        device_status = status_by_name.get(device_name)
+        device_info = info_by_name.get(device_name)
 
         if device_status and device_info:
             try:
@@ -60,6 +65,44 @@ def build_device_collections(
     return transmitters, receivers
 
 
+def refresh_device_collections(
+    transmitters: dict[str, Any],
+    receivers: dict[str, Any],
+    device_status_list: list[DeviceStatus],
+    device_info_list: list[DeviceInfo],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Build refreshed copies of existing devices from fresh status and info data.
+
+    The input collections and their devices are not modified. Devices without
+    matching status and info are dropped, mirroring build_device_collections.
+    """
+    status_by_name = {d.name: d for d in device_status_list}
+    info_by_name = {d.name: d for d in device_info_list}
+
+    refreshed: list[dict[str, Any]] = []
+    for devices in (transmitters, receivers):
+        collection = {}
+        for true_name, device in devices.items():
+            device_status = status_by_name.get(true_name)
+            device_info = info_by_name.get(true_name)
+
+            if device_status and device_info:
+                try:
+                    collection[true_name] = device.refreshed(device_status, device_info)
+                except Exception as err:
+                    _LOGGER.warning("Failed to refresh device %s: %s", true_name, err)
+        refreshed.append(collection)
+
+    refreshed_transmitters, refreshed_receivers = refreshed
+    _LOGGER.info(
+        "Successfully refreshed %d transmitters and %d receivers",
+        len(refreshed_transmitters),
+        len(refreshed_receivers),
+    )
+
+    return refreshed_transmitters, refreshed_receivers
+
+
 def process_matrix_assignments(matrix_response: Any) -> dict[str, str]:
     """Process matrix assignments into receiver alias -> source alias mapping."""
     matrix_assignments: dict[str, str] = {}
@@ -73,8 +116,9 @@ def process_matrix_assignments(matrix_response: Any) -> dict[str, str]:
 
         for assignment in assignments:
             if hasattr(assignment, "tx") and hasattr(assignment, "rx"):
-                source_alias = assignment.tx
-                receiver_alias = assignment.rx
+                # Intern aliases so lookups against device aliases can short-circuit on identity
+                source_alias = sys.intern(assignment.tx) if isinstance(assignment.tx, str) else assignment.tx
+                receiver_alias = sys.intern(assignment.rx) if isinstance(assignment.rx, str) else assignment.rx
                 matrix_assignments[receiver_alias] = source_alias
                 _LOGGER.debug("Matrix assignment: %s -> %s", source_alias, receiver_alias)
 
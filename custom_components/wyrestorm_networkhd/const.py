@@ -19,6 +19,7 @@ DEFAULT_PORT = 10022  # WyreStorm standard SSH port
 DEFAULT_USERNAME = "wyrestorm"  # Factory default SSH username
 DEFAULT_PASSWORD = "networkhd"  # Factory default SSH password (SECURITY: Change in production!)  # nosec B105
 DEFAULT_UPDATE_INTERVAL = 60  # Poll device every 60 seconds for status updates
+MATRIX_REFRESH_COOLDOWN = 0.5  # Seconds to coalesce matrix refreshes after routing changes
 
 # SSH Security Settings
 SSH_HOST_KEY_POLICY = "auto_add"  # Accept unknown host keys (convenience over strict security)
@@ -7,21 +7,23 @@ Home Assistant integration using the new model structure.
 import asyncio
 import logging
 from contextlib import suppress
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from wyrestorm_networkhd import NHDAPI, NetworkHDClientSSH
 
 from ._cache_utils import cache_for_seconds
-from ._utils_coordinator import build_device_collections, process_matrix_assignments
+from ._utils_coordinator import build_device_collections, process_matrix_assignments, refresh_device_collections
 from .const import (
     CONF_UPDATE_INTERVAL,
     DEFAULT_PORT,
     DEFAULT_UPDATE_INTERVAL,
+    MATRIX_REFRESH_COOLDOWN,
     SSH_HOST_KEY_POLICY,
 )
 from .models.coordinator import CoordinatorData
@@ -30,6 +32,14 @@ from .models.device_receiver_transmitter import DeviceReceiver, DeviceTransmitte
 
 _LOGGER = logging.getLogger(__name__)
 
+# Power states accepted by set_power
+_VALID_POWER_STATES = frozenset({"on", "off"})
+
+
+def _as_list(value: str | list[str]) -> list[str]:
+    """Wrap a single device alias/name in a list, passing lists through unchanged."""
+    return [value] if isinstance(value, str) else value
+
 
 class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
     """WyreStorm NetworkHD data coordinator.
@@ -83,6 +93,53 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
         # Create API wrapper
         self.api = NHDAPI(self.client)
 
+        # Set whenever a data update attempt finishes, successful or not (wait_for_data clears it before waiting)
+        self._update_finished = asyncio.Event()
+
+        # Number of entities that consume matrix assignments (matrix_get is skipped when zero)
+        self._matrix_consumers = 0
+
+        # Coalesce bursts of routing changes into a single matrix refresh
+        # (leading edge fires immediately, trailing edge picks up the final state)
+        self._matrix_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=MATRIX_REFRESH_COOLDOWN,
+            immediate=True,
+            function=self._async_refresh_matrix_assignments,
+        )
+
+    async def _async_refresh_matrix_assignments(self) -> None:
+        """Refresh matrix assignments only."""
+        await self.async_selective_refresh(["matrix_assignments"])
+
+    @callback
+    def async_add_matrix_consumer(self) -> CALLBACK_TYPE:
+        """Register an entity that needs matrix assignments.
+
+        Returns:
+            Callback that unregisters the consumer.
+        """
+        self._matrix_consumers += 1
+        if self._matrix_consumers == 1 and self.data is not None:
+            # First consumer: fetch assignments now rather than waiting for the next poll
+            self.entry.async_create_background_task(
+                self.hass, self._matrix_refresh_debouncer.async_call(), "wyrestorm_networkhd matrix refresh"
+            )
+
+        removed = False
+
+        @callback
+        def _remove_consumer() -> None:
+            # Safe to call more than once; only the first call unregisters
+            nonlocal removed
+            if removed:
+                return
+            removed = True
+            self._matrix_consumers -= 1
+
+        return _remove_consumer
+
     def _register_notification_handlers(self) -> None:
         """Register callbacks for real-time notifications from the device.
 
@@ -162,6 +219,26 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
         _LOGGER.debug("Fetching device info from API (will be cached for 10 minutes)...")
         return await self.api.api_query.config_get_device_info()
 
+    @cache_for_seconds(900)  # Cache controller version for 15 minutes
+    async def _get_cached_version(self):
+        """Get controller version with caching to reduce API calls.
+
+        Firmware versions only change on upgrade, so we cache them for
+        15 minutes rather than re-reading them on every poll.
+        """
+        _LOGGER.debug("Fetching version data from API (will be cached for 15 minutes)...")
+        return await self.api.api_query.config_get_version()
+
+    @cache_for_seconds(900)  # Cache controller IP settings for 15 minutes
+    async def _get_cached_ip_settings(self):
+        """Get controller IP settings with caching to reduce API calls.
+
+        Controller network settings only change on reconfiguration, so we
+        cache them for 15 minutes rather than re-reading them on every poll.
+        """
+        _LOGGER.debug("Fetching IP settings from API (will be cached for 15 minutes)...")
+        return await self.api.api_query.config_get_ipsetting()
+
     async def async_setup(self) -> None:
         """Set up the coordinator and establish connection."""
         try:
@@ -193,6 +270,10 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
         """Shut down the coordinator safely."""
         _LOGGER.debug("Starting coordinator shutdown...")
 
+        # Drop any pending debounced refreshes (the base class cancels its request-refresh debouncer and poll timer)
+        self._matrix_refresh_debouncer.async_cancel()
+        await super().async_shutdown()
+
         # Disconnect client
         if self.client and self.client.is_connected():
             try:
@@ -232,48 +313,27 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
             _LOGGER.debug("Starting selective data refresh for: %s", refresh_only)
 
             # Start with existing data
-            updated_data = CoordinatorData(
-                device_controller=self.data.device_controller,
-                device_transmitters=self.data.device_transmitters.copy(),
-                device_receivers=self.data.device_receivers.copy(),
-                matrix_assignments=self.data.matrix_assignments.copy(),
-            )
+            transmitters = self.data.device_transmitters.copy()
+            receivers = self.data.device_receivers.copy()
+            matrix_assignments = self.data.matrix_assignments.copy()
 
             # Selectively update requested data types
             if "matrix_assignments" in refresh_only:
                 _LOGGER.debug("Refreshing matrix assignments...")
                 matrix = await self.api.api_query.matrix_get()
-                updated_data.matrix_assignments = process_matrix_assignments(matrix)
+                matrix_assignments = process_matrix_assignments(matrix)
 
             if "device_status" in refresh_only:
                 _LOGGER.debug("Refreshing device status only...")
                 device_status_list = await self.api.api_query.config_get_device_status()
 
-                # Reconstruct device JSON from existing device data (no API call needed)
-                device_json_list = []
-                for device in list(self.data.device_transmitters.values()) + list(self.data.device_receivers.values()):
-                    from wyrestorm_networkhd.models.api_query import DeviceJsonString
-
-                    device_json = DeviceJsonString(
-                        aliasName=device.alias_name,
-                        deviceType=device.device_type,
-                        ip=device.ip,
-                        online=device.online,  # This will be updated from fresh status if changed
-                        sequence=device.sequence,
-                        trueName=device.true_name,
-                        group="",  # Default empty group
-                    )
-                    device_json_list.append(device_json)
-
                 # Use existing device info cache
                 device_info_list = await self._get_cached_device_info()
 
-                # Rebuild device collections with fresh status but cached info
-                transmitters, receivers = build_device_collections(
-                    device_json_list, device_status_list, device_info_list
+                # Build refreshed device copies with fresh status but cached info (live data stays untouched)
+                transmitters, receivers = refresh_device_collections(
+                    transmitters, receivers, device_status_list, device_info_list
                 )
-                updated_data.device_transmitters = transmitters
-                updated_data.device_receivers = receivers
 
             if "device_jsonstring" in refresh_only:
                 _LOGGER.debug("Refreshing device JSON string only...")
@@ -297,11 +357,14 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
                 transmitters, receivers = build_device_collections(
                     device_json_list, device_status_list, device_info_list
                 )
-                updated_data.device_transmitters = transmitters
-                updated_data.device_receivers = receivers
 
-            # Update timestamp and set data
-            updated_data.last_update = datetime.now()
+            # Build the new snapshot once so its derived indexes match the collections
+            updated_data = CoordinatorData(
+                device_controller=self.data.device_controller,
+                device_transmitters=transmitters,
+                device_receivers=receivers,
+                matrix_assignments=matrix_assignments,
+            )
             self.async_set_updated_data(updated_data)
 
             _LOGGER.debug("Selective refresh completed for: %s", refresh_only)
@@ -316,12 +379,14 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
         _LOGGER.debug("Starting data update...")
 
         try:
-            # Fetch all required data from API (no retry wrapper since client handles retries)
+            # Fetch all required data from API one query at a time over the single SSH session
+            # (no retry wrapper since client handles retries). Slow-changing topology comes from the
+            # caches: version and IP settings for 15 minutes, device info for 10 minutes.
             _LOGGER.debug("Fetching version data...")
-            version = await self.api.api_query.config_get_version()
+            version = await self._get_cached_version()
 
             _LOGGER.debug("Fetching IP settings...")
-            ip_settings = await self.api.api_query.config_get_ipsetting()
+            ip_settings = await self._get_cached_ip_settings()
 
             _LOGGER.debug("Fetching device JSON...")
             device_json_list = await self.api.api_query.config_get_devicejsonstring()
@@ -332,30 +397,43 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
             # Use cached device info (automatically cached for 10 minutes)
             device_info_list = await self._get_cached_device_info()
 
-            _LOGGER.debug("Fetching matrix data...")
-            matrix = await self.api.api_query.matrix_get()
+            # Matrix routing is only queried while an entity consumes it
+            matrix_skipped = not self._matrix_consumers
+            if matrix_skipped:
+                _LOGGER.debug("Skipping matrix query - no matrix consumers registered")
+                matrix = None
+            else:
+                _LOGGER.debug("Fetching matrix data...")
+                matrix = await self.api.api_query.matrix_get()
 
-            _LOGGER.debug(
-                "Retrieved data: version=%s, ip_settings=%s, device_json=%d devices, "
-                "device_status=%d devices, device_info=%d devices, matrix=%s",
-                version is not None,
-                ip_settings is not None,
-                len(device_json_list) if device_json_list else 0,
-                len(device_status_list) if device_status_list else 0,
-                len(device_info_list) if device_info_list else 0,
-                matrix is not None,
-            )
+            # Normalize missing lists once for logging and collection building
+            device_json_list = device_json_list or []
+            device_status_list = device_status_list or []
+            device_info_list = device_info_list or []
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Retrieved data: version=%s, ip_settings=%s, device_json=%d devices, "
+                    "device_status=%d devices, device_info=%d devices, matrix=%s",
+                    version is not None,
+                    ip_settings is not None,
+                    len(device_json_list),
+                    len(device_status_list),
+                    len(device_info_list),
+                    matrix is not None,
+                )
 
             # Create controller device
             controller = DeviceController.from_wyrestorm_models(version, ip_settings)
 
             # Build device collections
-            transmitters, receivers = build_device_collections(
-                device_json_list or [], device_status_list or [], device_info_list or []
-            )
+            transmitters, receivers = build_device_collections(device_json_list, device_status_list, device_info_list)
 
-            # Process matrix assignments
-            matrix_assignments = process_matrix_assignments(matrix)
+            # Process matrix assignments (a skipped query keeps the last known routing)
+            if matrix_skipped and self.data is not None:
+                matrix_assignments = self.data.matrix_assignments.copy()
+            else:
+                matrix_assignments = process_matrix_assignments(matrix)
 
             # Create coordinator data
             data = CoordinatorData(
@@ -363,7 +441,6 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
                 device_transmitters=transmitters,
                 device_receivers=receivers,
                 matrix_assignments=matrix_assignments,
-                last_update=datetime.now(),
             )
 
             _LOGGER.debug(
@@ -378,20 +455,29 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
             _LOGGER.error("Data update failed: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        finally:
+            # Waiters resume after DataUpdateCoordinator has stored the returned data (or the failure)
+            self._update_finished.set()
+
     # Service methods
-    async def set_matrix(self, source: str | list[str] | None, target: str | list[str]) -> None:
+    async def set_matrix(
+        self, source: str | list[str] | None, target: str | list[str], background: bool = True
+    ) -> None:
         """Set matrix routing with validation.
 
         Args:
             source: Source device(s) alias name, or None to disconnect target(s)
             target: Target device(s) alias name
+            background: Schedule a debounced follow-up refresh as a background task instead of awaiting it.
+                Entities use the default so the command returns as soon as it is sent; service
+                calls pass False, which refreshes directly so callers see the new routing once
+                the call completes.
         """
-        if isinstance(target, str):
-            target = [target]
+        target = _as_list(target)
 
         # Validate target devices exist (common for both connect and disconnect)
         if self.data:
-            valid_target_aliases = {rx.alias_name for rx in self.data.get_receivers_list()}
+            valid_target_aliases = self.data.receiver_alias_set
             for tgt in target:
                 if tgt not in valid_target_aliases:
                     raise ValueError(f"Target device '{tgt}' not found")
@@ -403,24 +489,30 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
             _LOGGER.info("Disconnected receivers: %s", target)
         else:
             # Handle normal matrix routing
-            if isinstance(source, str):
-                source = [source]
+            source = _as_list(source)
 
             # Validate source devices exist
             if self.data:
-                valid_source_aliases = {tx.alias_name for tx in self.data.get_transmitters_list()}
+                valid_source_aliases = self.data.transmitter_alias_set
                 for src in source:
                     if src not in valid_source_aliases:
                         raise ValueError(f"Source device '{src}' not found")
 
-            # Execute matrix commands using alias names
+            # Execute matrix commands using alias names, in order (the last source routed to a target wins)
             for src in source:
                 await self.api.media_stream_matrix_switch.matrix_set(src, target)
 
             _LOGGER.info("Matrix set successful: %s -> %s", source, target)
 
         # Refresh data - matrix assignments
-        await self.async_selective_refresh(["matrix_assignments"])
+        if background:
+            # Debounced across rapid routing changes
+            self.entry.async_create_background_task(
+                self.hass, self._matrix_refresh_debouncer.async_call(), "wyrestorm_networkhd matrix refresh"
+            )
+        else:
+            # Bypass the debouncer: during its cooldown it would only schedule a trailing run and return
+            await self._async_refresh_matrix_assignments()
 
     async def set_power(self, devices: str | list[str], power_state: str) -> None:
         """Control device power with validation.
@@ -429,21 +521,20 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
             devices: Device(s) true name
             power_state: "on" or "off"
         """
-        if isinstance(devices, str):
-            devices = [devices]
+        devices = _as_list(devices)
 
-        if power_state not in ["on", "off"]:
+        if power_state not in _VALID_POWER_STATES:
             raise ValueError(f"Invalid power state: {power_state}")
 
         # Validate devices exist and are receivers
         if self.data:
-            valid_receivers = set(self.data.device_receivers.keys())
+            valid_receivers = self.data.device_receivers
 
             for device in devices:
                 if device not in valid_receivers:
                     raise ValueError(f"Device '{device}' not found or does not support power control")
 
-        # Send power commands
+        # Send power commands in order over the single SSH session
         for device in devices:
             await self.api.connected_device_control.config_set_device_sinkpower(power=power_state, rx=device)
 
@@ -472,31 +563,31 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
             return 0
         return len(self.data.device_transmitters) + len(self.data.device_receivers)
 
-    def get_transmitters(self) -> list[DeviceTransmitter]:
+    def get_transmitters(self) -> tuple[DeviceTransmitter, ...]:
         """Get all transmitter devices.
 
         Returns:
-            List of DeviceTransmitter objects, or empty list if not ready.
+            Tuple of DeviceTransmitter objects, or empty tuple if not ready.
 
         Note:
-            Returns a copy of the internal list to prevent external modifications.
+            Returns an immutable tuple cached on the data snapshot, so callers cannot modify it.
         """
         if not self.is_ready():
-            return []
-        return list(self.data.device_transmitters.values())
+            return ()
+        return self.data.get_transmitters_tuple()
 
-    def get_receivers(self) -> list[DeviceReceiver]:
+    def get_receivers(self) -> tuple[DeviceReceiver, ...]:
         """Get all receiver devices.
 
         Returns:
-            List of DeviceReceiver objects, or empty list if not ready.
+            Tuple of DeviceReceiver objects, or empty tuple if not ready.
 
         Note:
-            Returns a copy of the internal list to prevent external modifications.
+            Returns an immutable tuple cached on the data snapshot, so callers cannot modify it.
         """
         if not self.is_ready():
-            return []
-        return list(self.data.device_receivers.values())
+            return ()
+        return self.data.get_receivers_tuple()
 
     def get_controller(self) -> DeviceController | None:
         """Get the controller device.
@@ -512,22 +603,22 @@ class WyreStormCoordinator(DataUpdateCoordinator[CoordinatorData]):
         controller = self.data.device_controller
         return controller if isinstance(controller, DeviceController) else None
 
-    async def wait_for_data(self, timeout: int = 30) -> bool:
-        """Wait for data to be available with timeout."""
-        start_time = asyncio.get_event_loop().time()
+    async def wait_for_data(self, timeout: float = 30) -> bool:
+        """Wait for data to be available with timeout.
 
-        while not self.is_ready() and (asyncio.get_event_loop().time() - start_time) < timeout:
-            _LOGGER.debug(
-                "Waiting for coordinator data... (%.1fs remaining)",
-                timeout - (asyncio.get_event_loop().time() - start_time),
-            )
-            await asyncio.sleep(1)
-
-            # Try to refresh if we don't have data
-            if not self.data:
-                try:
-                    await self.async_request_refresh()
-                except Exception as err:
-                    _LOGGER.debug("Refresh attempt failed: %s", err)
+        Requests a refresh and waits for the next update attempt to finish, so a
+        failed update returns False straight away instead of waiting out the timeout.
+        """
+        if self.is_ready():
+            return True
+
+        _LOGGER.debug("Waiting up to %ss for coordinator data...", timeout)
+        self._update_finished.clear()
+        try:
+            async with asyncio.timeout(timeout):
+                await self.async_request_refresh()
+                await self._update_finished.wait()
+        except TimeoutError:
+            _LOGGER.debug("Timed out waiting for coordinator data")
 
         return self.is_ready()
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import sys
+import time
+from collections.abc import ValuesView
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -9,7 +12,7 @@ from .device_controller import DeviceController
 from .device_receiver_transmitter import DeviceReceiver, DeviceTransmitter
 
 
-@dataclass
+@dataclass(slots=True)
 class CoordinatorData:
     """Data model for WyreStorm NetworkHD Coordinator.
 
@@ -25,29 +28,87 @@ class CoordinatorData:
     # Matrix assignments: receiver alias -> source alias
     matrix_assignments: dict[str, str] = field(default_factory=dict)
 
-    # Metadata
-    last_update: datetime = field(default_factory=datetime.now)
+    # Derived indexes, maintained by the device management methods below
+    transmitter_aliases: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    transmitter_alias_set: frozenset[str] = field(default_factory=frozenset, init=False, repr=False, compare=False)
+    receiver_alias_set: frozenset[str] = field(default_factory=frozenset, init=False, repr=False, compare=False)
+    _alias_index: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _transmitters_snapshot: tuple[DeviceTransmitter, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _receivers_snapshot: tuple[DeviceReceiver, ...] | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Metadata: last mutation time in epoch nanoseconds, exposed as a datetime on read
+    _last_update_ns: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Update timestamp after initialization."""
-        self.last_update = datetime.now()
+        """Update timestamp and build derived indexes after initialization."""
+        self._last_update_ns = time.time_ns()
+        self._rebuild_transmitter_aliases()
+        self._rebuild_receiver_aliases()
+
+    @property
+    def version(self) -> int:
+        """Mutation counter, incremented whenever devices or assignments change."""
+        return self._version
+
+    @property
+    def last_update(self) -> datetime:
+        """Time of the last mutation (or creation), computed on access."""
+        return datetime.fromtimestamp(self._last_update_ns / 1e9)
+
+    def _touch(self) -> None:
+        """Record a mutation by bumping the version and timestamp."""
+        self._version += 1
+        self._last_update_ns = time.time_ns()
+
+    def _rebuild_transmitter_aliases(self) -> None:
+        """Rebuild the transmitter alias column from the transmitter collection."""
+        self.transmitter_aliases = [tx.alias_name for tx in self.device_transmitters.values()]
+        self._alias_index = {true_name: slot for slot, true_name in enumerate(self.device_transmitters)}
+        self.transmitter_alias_set = frozenset(self.transmitter_aliases)
+
+    def _rebuild_receiver_aliases(self) -> None:
+        """Rebuild the receiver alias set from the receiver collection."""
+        self.receiver_alias_set = frozenset(rx.alias_name for rx in self.device_receivers.values())
 
     # Device list getters
-    def get_transmitters_list(self) -> list[DeviceTransmitter]:
-        """Get all transmitters as a list.
+    def get_transmitters_list(self) -> ValuesView[DeviceTransmitter]:
+        """Get all transmitters as a live view (wrap in list() if a copy is needed).
+
+        Returns:
+            View of all transmitters
+        """
+        return self.device_transmitters.values()
+
+    def get_receivers_list(self) -> ValuesView[DeviceReceiver]:
+        """Get all receivers as a live view (wrap in list() if a copy is needed).
+
+        Returns:
+            View of all receivers
+        """
+        return self.device_receivers.values()
+
+    def get_transmitters_tuple(self) -> tuple[DeviceTransmitter, ...]:
+        """Get all transmitters as an immutable tuple, cached until a transmitter is added or removed.
 
         Returns:
-            List of all transmitters
+            Tuple of all transmitters
         """
-        return list(self.device_transmitters.values())
+        if self._transmitters_snapshot is None:
+            self._transmitters_snapshot = tuple(self.device_transmitters.values())
+        return self._transmitters_snapshot
 
-    def get_receivers_list(self) -> list[DeviceReceiver]:
-        """Get all receivers as a list.
+    def get_receivers_tuple(self) -> tuple[DeviceReceiver, ...]:
+        """Get all receivers as an immutable tuple, cached until a receiver is added or removed.
 
         Returns:
-            List of all receivers
+            Tuple of all receivers
         """
-        return list(self.device_receivers.values())
+        if self._receivers_snapshot is None:
+            self._receivers_snapshot = tuple(self.device_receivers.values())
+        return self._receivers_snapshot
 
     # Device management methods
     def update_device(self, device: DeviceReceiver | DeviceTransmitter) -> bool:
@@ -59,18 +120,35 @@ class CoordinatorData:
         Returns:
             True if device was updated, False if it was added (new device)
         """
-        if isinstance(device, DeviceReceiver):
-            key = device.true_name
-            was_existing = key in self.device_receivers
-            self.device_receivers[key] = device
-        elif isinstance(device, DeviceTransmitter):
-            key = device.true_name
-            was_existing = key in self.device_transmitters
-            self.device_transmitters[key] = device
+        # Device models are concrete leaf classes, so an identity check is sufficient
+        device_class = type(device)
+        if device_class is DeviceReceiver:
+            store = self.device_receivers
+            self._receivers_snapshot = None
+        elif device_class is DeviceTransmitter:
+            store = self.device_transmitters
+            self._transmitters_snapshot = None
         else:
-            raise ValueError(f"Unknown device type: {type(device)}")
-
-        self.last_update = datetime.now()
+            raise ValueError(f"Unknown device type: {device_class}")
+
+        key = device.true_name
+        previous = store.get(key)
+        was_existing = previous is not None
+        store[key] = device
+
+        if device_class is DeviceTransmitter:
+            # Keep the alias column aligned with the transmitter dict order
+            slot = self._alias_index.get(key)
+            if slot is None:
+                self._alias_index[key] = len(self.transmitter_aliases)
+                self.transmitter_aliases.append(device.alias_name)
+            else:
+                self.transmitter_aliases[slot] = device.alias_name
+            self.transmitter_alias_set = frozenset(self.transmitter_aliases)
+        elif previous is None or previous.alias_name != device.alias_name:
+            self._rebuild_receiver_aliases()
+
+        self._touch()
         return was_existing
 
     def remove_device(self, true_name: str) -> bool:
@@ -82,18 +160,19 @@ class CoordinatorData:
         Returns:
             True if a device was removed, False if no device was found
         """
-        removed = False
-        if true_name in self.device_receivers:
-            del self.device_receivers[true_name]
-            removed = True
-        elif true_name in self.device_transmitters:
-            del self.device_transmitters[true_name]
-            removed = True
-
-        if removed:
-            self.last_update = datetime.now()
+        removed = self.device_receivers.pop(true_name, None)
+        if removed is not None:
+            self._receivers_snapshot = None
+            self._rebuild_receiver_aliases()
+        else:
+            removed = self.device_transmitters.pop(true_name, None)
+            if removed is None:
+                return False
+            self._transmitters_snapshot = None
+            self._rebuild_transmitter_aliases()
 
-        return removed
+        self._touch()
+        return True
 
     # Matrix assignment methods
     def update_matrix_assignment(self, receiver_alias: str, source_alias: str) -> bool:
@@ -107,8 +186,8 @@ class CoordinatorData:
             True if assignment was updated, False if it was added (new assignment)
         """
         was_existing = receiver_alias in self.matrix_assignments
-        self.matrix_assignments[receiver_alias] = source_alias
-        self.last_update = datetime.now()
+        self.matrix_assignments[sys.intern(receiver_alias)] = source_alias
+        self._touch()
         return was_existing
 
     def remove_matrix_assignment(self, receiver_alias: str) -> bool:
@@ -122,6 +201,6 @@ class CoordinatorData:
         """
         if receiver_alias in self.matrix_assignments:
             del self.matrix_assignments[receiver_alias]
-            self.last_update = datetime.now()
+            self._touch()
             return True
         return False
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from wyrestorm_networkhd.models.api_query import IpSetting, Version
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceController:
     """Model representing the physical WyreStorm NetworkHD Controller hardware.
 
@@ -27,9 +27,9 @@ class DeviceController:
     netmask: str
     gateway: str
 
-    def __post_init__(self):
-        self.manufacturer: str = "WyreStorm"
-        self.model: str = "NetworkHD Controller"
+    # Static hardware identity (declared as fields so they fit the slot layout)
+    manufacturer: str = field(init=False, default="WyreStorm")
+    model: str = field(init=False, default="NetworkHD Controller")
 
     # Factory methods
     @classmethod
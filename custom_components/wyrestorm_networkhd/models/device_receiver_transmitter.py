@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import sys
+from copy import copy
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, ClassVar, Self
 
 if TYPE_CHECKING:
     from wyrestorm_networkhd.models.api_query import DeviceInfo, DeviceJsonString, DeviceStatus
 
+# Canonical device type names keyed by the lowercased API value
+_DEVICE_TYPE_TITLES = {"receiver": "Receiver", "transmitter": "Transmitter"}
 
-@dataclass
+
+@lru_cache(maxsize=512)
+def _format_display_name(device_type: str, name_part: str) -> str:
+    """Format a device display name, reusing the result for repeated inputs."""
+    return f"{device_type} - {name_part}"
+
+
+@dataclass(slots=True)
 class DeviceBase:
     """Base class for WyreStorm NetworkHD devices with common attributes."""
 
@@ -34,9 +46,41 @@ class DeviceBase:
     stream_frame_rate: int | None = None
     stream_resolution: str | None = None
 
+    # Hardware identity (declared as fields so they fit the slot layout)
+    manufacturer: str = field(init=False, default="WyreStorm")
+    model: str = field(init=False, default="")
+
+    # Fields refreshed from DeviceStatus / DeviceInfo (names match the source models)
+    _STATUS_FIELDS: ClassVar[tuple[str, ...]] = ("line_out_audio_enable", "stream_frame_rate", "stream_resolution")
+    _INFO_FIELDS: ClassVar[tuple[str, ...]] = ("mac", "gateway", "netmask", "version", "edid", "ip_mode")
+
     def __post_init__(self):
-        self.manufacturer: str = "WyreStorm"
-        self.model: str = self.true_name
+        # Intern the strings used as lookup keys so dict lookups can short-circuit on identity
+        self.alias_name = sys.intern(self.alias_name) if self.alias_name else self.alias_name
+        self.true_name = sys.intern(self.true_name)
+        self.device_type = sys.intern(self.device_type)
+        self.model = self.true_name
+
+    def refreshed(self, device_status: DeviceStatus, device_info: DeviceInfo) -> Self:
+        """Return a copy with fresh status and info fields, keeping identity fields.
+
+        The device itself is left untouched, so snapshots already handed to
+        entities never change underneath them. The copy is shallow and skips
+        __init__/__post_init__, so only the refreshed fields are written.
+
+        Args:
+            device_status: DeviceStatus model from wyrestorm-networkhd package
+            device_info: DeviceInfo model from wyrestorm-networkhd package
+
+        Returns:
+            New device of the same type with the refreshed fields
+        """
+        device = copy(self)
+        for name in self._STATUS_FIELDS:
+            setattr(device, name, getattr(device_status, name))
+        for name in self._INFO_FIELDS:
+            setattr(device, name, getattr(device_info, name))
+        return device
 
     # Display methods
     def get_device_display_name(self) -> str:
@@ -49,10 +93,10 @@ class DeviceBase:
         Example:
             "Receiver - Living Room TV" or "Transmitter - 192.168.1.100"
         """
-        return f"{self.device_type} - {self.alias_name or self.ip or self.true_name}"
+        return _format_display_name(self.device_type, self.alias_name or self.ip or self.true_name)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceReceiver(DeviceBase):
     """Model representing a WyreStorm NetworkHD Receiver device.
 
@@ -86,8 +130,29 @@ class DeviceReceiver(DeviceBase):
     video_stretch_type: str | None = None
     video_timing: str | None = None
 
+    _STATUS_FIELDS: ClassVar[tuple[str, ...]] = (
+        *DeviceBase._STATUS_FIELDS,
+        "audio_bitrate",
+        "audio_input_format",
+        "hdcp_status",
+        "hdmi_out_active",
+        "hdmi_out_audio_enable",
+        "hdmi_out_frame_rate",
+        "hdmi_out_resolution",
+        "stream_error_count",
+    )
+    _INFO_FIELDS: ClassVar[tuple[str, ...]] = (
+        *DeviceBase._INFO_FIELDS,
+        "sourcein",
+        "analog_audio_source",
+        "hdmi_audio_source",
+        "video_mode",
+        "video_stretch_type",
+        "video_timing",
+    )
 
-@dataclass
+
+@dataclass(slots=True)
 class DeviceTransmitter(DeviceBase):
     """Model representing a WyreStorm NetworkHD Transmitter device."""
 
@@ -116,6 +181,31 @@ class DeviceTransmitter(DeviceBase):
     video_input: bool | None = None
     video_source: str | None = None
 
+    _STATUS_FIELDS: ClassVar[tuple[str, ...]] = (
+        *DeviceBase._STATUS_FIELDS,
+        "audio_stream_ip_address",
+        "encoding_enable",
+        "hdmi_in_active",
+        "hdmi_in_frame_rate",
+        "resolution",
+        "video_stream_ip_address",
+    )
+    _INFO_FIELDS: ClassVar[tuple[str, ...]] = (
+        *DeviceBase._INFO_FIELDS,
+        "audio_input_type",
+        "analog_audio_direction",
+        "bandwidth_adjust_mode",
+        "bit_perpixel",
+        "color_space",
+        "stream0_enable",
+        "stream0fps_by2_enable",
+        "stream1_enable",
+        "stream1_scale",
+        "stream1fps_by2_enable",
+        "video_input",
+        "video_source",
+    )
+
 
 def create_device_from_wyrestorm_models(
     device_json: DeviceJsonString, device_status: DeviceStatus, device_info: DeviceInfo
@@ -130,12 +220,15 @@ def create_device_from_wyrestorm_models(
     Returns:
         DeviceReceiver or DeviceTransmitter instance based on device type
     """
+    # Resolve the canonical device type (case insensitive) via table lookup
+    device_type = _DEVICE_TYPE_TITLES.get(device_json.deviceType.lower())
+
     # Common fields for both device types
     common_kwargs = {
         # From DeviceJsonString
         "alias_name": device_json.aliasName,
         "true_name": device_json.trueName,
-        "device_type": device_json.deviceType,
+        "device_type": device_type,
         "ip": device_json.ip,
         "online": device_json.online,
         "sequence": device_json.sequence,
@@ -152,9 +245,8 @@ def create_device_from_wyrestorm_models(
         "stream_resolution": device_status.stream_resolution,
     }
 
-    # Create appropriate subclass based on device type (case insensitive)
-    device_type_lower = device_json.deviceType.lower()
-    if device_type_lower == "receiver":
+    # Create appropriate subclass based on device type
+    if device_type == "Receiver":
         return DeviceReceiver(
             **common_kwargs,
             # RX specific fields from DeviceJsonString
@@ -177,7 +269,7 @@ def create_device_from_wyrestorm_models(
             video_timing=device_info.video_timing,
         )
 
-    elif device_type_lower == "transmitter":
+    elif device_type == "Transmitter":
         return DeviceTransmitter(
             **common_kwargs,
             # TX specific fields from DeviceJsonString
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import sys
+from functools import lru_cache
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -13,10 +15,20 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import WyreStormCoordinator
+from .models.coordinator import CoordinatorData
 from .models.device_receiver_transmitter import DeviceReceiver
 
 _LOGGER = logging.getLogger(__name__)
 
+# Option used to disconnect a receiver from any source
+_NONE_OPTION = "None"
+
+
+@lru_cache(maxsize=512)
+def _device_info_for(device_id: str) -> DeviceInfo:
+    """Return the DeviceInfo for a device, shared by entities of the same device (bounded cache)."""
+    return DeviceInfo(identifiers={(DOMAIN, device_id)})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -30,12 +42,12 @@ async def async_setup_entry(
         _LOGGER.warning("Coordinator data not ready for select setup")
         return
 
-    entities = []
-
     # Create source selection entities for receivers only
-    for device in coordinator.get_receivers():
-        entities.append(WyreStormReceiverSourceSelect(coordinator, device))
-        _LOGGER.debug("Created source select for receiver %s", device.true_name)
+    entities = [WyreStormReceiverSourceSelect(coordinator, device) for device in coordinator.get_receivers()]
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        for entity in entities:
+            _LOGGER.debug("Created source select for receiver %s", entity.device_id)
 
     if entities:
         async_add_entities(entities)
@@ -47,6 +59,12 @@ async def async_setup_entry(
 class WyreStormReceiverSourceSelect(CoordinatorEntity[WyreStormCoordinator], SelectEntity):
     """Representation of a WyreStorm NetworkHD receiver source selection."""
 
+    # Invariant entity attributes, shared by all instances
+    _attr_name = "Input Source"
+    _attr_icon = "mdi:video-switch"
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_has_entity_name = True
+
     def __init__(
         self,
         coordinator: WyreStormCoordinator,
@@ -56,67 +74,88 @@ class WyreStormReceiverSourceSelect(CoordinatorEntity[WyreStormCoordinator], Sel
         super().__init__(coordinator)
         self.device_id = device.true_name
 
-        # Set entity attributes
-        self._attr_unique_id = f"{DOMAIN}_{self.device_id}_source"
-        self._attr_name = "Input Source"
-        self._attr_icon = "mdi:video-switch"
-        self._attr_entity_category = EntityCategory.CONFIG
-        self._attr_has_entity_name = True
-        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, self.device_id)})
+        # Receiver alias and options caches, re-derived only when the coordinator data changes
+        self._receiver_alias: str | None = device.alias_name
+        self._cached_options: list[str] = []
+        self._cache_data: CoordinatorData | None = None
+        self._cache_version = -1
+
+        # Set per-device entity attributes
+        self._attr_unique_id = sys.intern(f"{DOMAIN}_{self.device_id}_source")
+        self._attr_device_info = _device_info_for(self.device_id)
+
+    async def async_added_to_hass(self) -> None:
+        """Register as a matrix assignment consumer when added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_matrix_consumer())
+
+    def _refresh_cache(self, data: CoordinatorData) -> None:
+        """Re-derive cached values if the coordinator data snapshot or its version has changed."""
+        if data is self._cache_data and data.version == self._cache_version:
+            return
+
+        receiver = data.device_receivers.get(self.device_id)
+        self._receiver_alias = receiver.alias_name if receiver else None
+        # Transmitter aliases (maintained on the data model) with None option for disconnecting
+        self._cached_options = [_NONE_OPTION, *data.transmitter_aliases]
+        self._cache_data = data
+        self._cache_version = data.version
+
+    def _get_receiver_alias(self, data: CoordinatorData) -> str | None:
+        """Return the receiver alias, refreshing the cache if the data has changed."""
+        self._refresh_cache(data)
+        return self._receiver_alias
 
     @property
     def current_option(self) -> str | None:
         """Return the currently selected source."""
-        if not self.coordinator.data:
+        if not (data := self.coordinator.data):
             return None
 
         # Check matrix assignments to see what's connected to this receiver
-        receiver_alias = None
-        if self.device_id in self.coordinator.data.device_receivers:
-            receiver = self.coordinator.data.device_receivers[self.device_id]
-            receiver_alias = receiver.alias_name
-
+        receiver_alias = self._get_receiver_alias(data)
         if not receiver_alias:
             return None
 
         # Look up current assignment
-        current_source_alias = self.coordinator.data.matrix_assignments.get(receiver_alias)
+        current_source_alias = data.matrix_assignments.get(receiver_alias)
+
+        # Return "None" if no assignment
+        if not current_source_alias:
+            return _NONE_OPTION
 
-        # Return "None" if no assignment, otherwise return the source alias
-        return current_source_alias if current_source_alias else "None"
+        # Only report sources that are valid options (unknown sources are reported as unknown state)
+        if current_source_alias in data.transmitter_alias_set:
+            return current_source_alias
+        return None
 
     @property
     def options(self) -> list[str]:
         """Return list of available sources."""
-        if not self.coordinator.data:
+        if not (data := self.coordinator.data):
             return []
 
-        # Return list of transmitter aliases with None option for disconnecting
-        transmitter_options = [tx.alias_name for tx in self.coordinator.data.get_transmitters_list()]
-        return ["None"] + transmitter_options
+        self._refresh_cache(data)
+        return self._cached_options
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.coordinator.data is not None and self.device_id in self.coordinator.data.device_receivers
+        return (data := self.coordinator.data) is not None and self.device_id in data.device_receivers
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected source."""
-        if not self.coordinator.data:
+        if not (data := self.coordinator.data):
             return
 
         # Find receiver alias
-        receiver_alias = None
-        if self.device_id in self.coordinator.data.device_receivers:
-            receiver = self.coordinator.data.device_receivers[self.device_id]
-            receiver_alias = receiver.alias_name
-
+        receiver_alias = self._get_receiver_alias(data)
         if not receiver_alias:
             _LOGGER.error("Could not find receiver alias for %s", self.device_id)
             return
 
         try:
-            if option == "None":
+            if option == _NONE_OPTION:
                 # Disconnect the receiver (set to no source)
                 await self.coordinator.set_matrix(None, receiver_alias)
             else:
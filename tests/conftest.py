@@ -12,5 +12,6 @@ custom_components_path = project_root / "custom_components"
 if custom_components_path.exists():
     sys.path.insert(0, str(custom_components_path.parent))
 
-# Import all fixtures from _fixtures.py to make them available globally
+# Import all fixtures from _fixtures.py to make them available globally. Test modules must not
+# re-import them: each import registers a separate fixture, so session-scoped values stop being shared.
 from tests.custom_components.wyrestorm_networkhd._fixtures import *  # noqa: E402, F401, F403
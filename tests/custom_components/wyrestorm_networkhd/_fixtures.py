@@ -12,9 +12,19 @@ Organization by Model/Category:
     6. Matrix Assignments - Routing assignment fixtures
     7. Multi-Device Systems - Integration testing fixtures
     8. Utility & Edge Cases - Error conditions and boundary testing
+    9. WyreStormCoordinator - Coordinator fixtures backed by a mocked API
+
+Fixtures that no test modifies are session-scoped so each object is built once
+per run. Fixtures that tests mutate in place keep the default function scope.
 """
 
+from dataclasses import replace
+from types import MappingProxyType
+from unittest.mock import AsyncMock, patch
+
 import pytest
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 from wyrestorm_networkhd.models.api_query import (
     DeviceInfo,
     DeviceJsonString,
@@ -26,50 +36,134 @@ from wyrestorm_networkhd.models.api_query import (
     Version,
 )
 
+from custom_components.wyrestorm_networkhd.const import DOMAIN
+from custom_components.wyrestorm_networkhd.coordinator import WyreStormCoordinator
 from custom_components.wyrestorm_networkhd.models.coordinator import CoordinatorData
 from custom_components.wyrestorm_networkhd.models.device_controller import DeviceController
 from custom_components.wyrestorm_networkhd.models.device_receiver_transmitter import (
     DeviceReceiver,
     DeviceTransmitter,
+    create_device_from_wyrestorm_models,
 )
 
+# DeviceInfo template with every optional field unset; fixtures override only what they need
+_DEVICE_INFO_BASE = DeviceInfo(
+    aliasname="",
+    name="",
+    edid=None,
+    gateway="",
+    ip4addr="",
+    ip_mode=None,
+    mac="",
+    netmask="",
+    version="",
+    # Receiver fields
+    sourcein=None,
+    analog_audio_source=None,
+    hdmi_audio_source=None,
+    video_mode=None,
+    video_stretch_type=None,
+    video_timing=None,
+    audio=None,
+    sinkpower=None,
+    # Transmitter fields
+    audio_input_type=None,
+    analog_audio_direction=None,
+    bandwidth_adjust_mode=None,
+    bit_perpixel=None,
+    color_space=None,
+    stream0_enable=None,
+    stream0fps_by2_enable=None,
+    stream1_enable=None,
+    stream1_scale=None,
+    stream1fps_by2_enable=None,
+    video_input=None,
+    video_source=None,
+    # Unused/optional fields
+    cbr_avg_bitrate=None,
+    enc_fps=None,
+    enc_gop=None,
+    enc_rc_mode=None,
+    fixqp_iqp=None,
+    fixqp_pqp=None,
+    profile=None,
+    transport_type=None,
+    vbr_max_bitrate=None,
+    vbr_max_qp=None,
+    vbr_min_qp=None,
+    km_over_ip_enable=None,
+    videodetection=None,
+    serial_param=None,
+    temperature=None,
+    genlock_scaling_resolution=None,
+)
+
+
+# Shared "ungrouped" group entries, indexed by sequence number
+_UNGROUPED_GROUPS = tuple(DeviceJsonStringGroup(name="ungrouped", sequence=i) for i in range(16))
+
+# Shared DeviceReceiver/DeviceTransmitter defaults; fixtures pass only the fields that differ
+_DEVICE_DEFAULTS = MappingProxyType(
+    {
+        "ip": "",
+        "online": True,
+        "sequence": 1,
+        "mac": "00:00:00:00:00:00",
+        "gateway": "0.0.0.0",
+        "netmask": "255.255.255.0",
+        "version": "0.0.0",
+        "edid": "",
+        "ip_mode": "static",
+    }
+)
+
+
+def _rx(**overrides):
+    """Build a DeviceReceiver from the shared defaults."""
+    return DeviceReceiver(**{**_DEVICE_DEFAULTS, "device_type": "Receiver", **overrides})
+
+
+def _tx(**overrides):
+    """Build a DeviceTransmitter from the shared defaults."""
+    return DeviceTransmitter(**{**_DEVICE_DEFAULTS, "device_type": "Transmitter", **overrides})
+
+
 # =============================================================================
 # WYRESTORM API MODELS
 # =============================================================================
 # Fixtures for external WyreStorm API models
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def version_fixture():
     """Standard Version with common version numbers."""
     return Version(api_version="1.0.0", web_version="2.1.0", core_version="3.0.1")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def alternative_version_fixture():
     """Alternative Version with different version numbers for comparison tests."""
     return Version(api_version="2.5.0", web_version="3.2.1", core_version="4.1.2")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ip_setting_fixture():
     """Standard IpSetting with common network configuration."""
     return IpSetting(ip4addr="192.168.1.100", netmask="255.255.255.0", gateway="192.168.1.1")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def alternative_ip_setting_fixture():
     """Alternative IpSetting with different network configuration for comparison tests."""
     return IpSetting(ip4addr="10.0.0.50", netmask="255.255.0.0", gateway="10.0.0.1")
 
 
-@pytest.fixture
-def device_json_receiver_fixture():
+def _device_json_receiver():
     """DeviceJsonString for a typical receiver device."""
     return DeviceJsonString(
         aliasName="Living Room RX",
         deviceType="Receiver",
-        group=[DeviceJsonStringGroup(name="ungrouped", sequence=1)],
+        group=[_UNGROUPED_GROUPS[1]],
         ip="192.168.1.101",
         online=True,
         sequence=1,
@@ -79,12 +173,18 @@ def device_json_receiver_fixture():
 
 
 @pytest.fixture
+def device_json_receiver_fixture():
+    """DeviceJsonString for a typical receiver device. Rebuilt per test since tests mutate it."""
+    return _device_json_receiver()
+
+
+@pytest.fixture(scope="session")
 def device_json_transmitter_fixture():
     """DeviceJsonString for a typical transmitter device."""
     return DeviceJsonString(
         aliasName="Apple TV",
         deviceType="Transmitter",
-        group=[DeviceJsonStringGroup(name="ungrouped", sequence=2)],
+        group=[_UNGROUPED_GROUPS[2]],
         ip="192.168.1.102",
         online=True,
         sequence=2,
@@ -93,8 +193,7 @@ def device_json_transmitter_fixture():
     )
 
 
-@pytest.fixture
-def device_status_receiver_fixture():
+def _device_status_receiver():
     """DeviceStatus for a receiver with comprehensive status data."""
     return DeviceStatus(
         aliasname="Living Room RX",
@@ -116,6 +215,12 @@ def device_status_receiver_fixture():
 
 
 @pytest.fixture
+def device_status_receiver_fixture():
+    """DeviceStatus for a receiver with comprehensive status data. Rebuilt per test since tests mutate it."""
+    return _device_status_receiver()
+
+
+@pytest.fixture(scope="session")
 def device_status_transmitter_fixture():
     """DeviceStatus for a transmitter with comprehensive status data."""
     return DeviceStatus(
@@ -135,10 +240,10 @@ def device_status_transmitter_fixture():
     )
 
 
-@pytest.fixture
-def device_info_receiver_fixture():
+def _device_info_receiver():
     """DeviceInfo for a receiver with complete device information."""
-    return DeviceInfo(
+    return replace(
+        _DEVICE_INFO_BASE,
         aliasname="Living Room RX",
         name="NHD-200-RX-01",
         # Common device information fields
@@ -156,45 +261,20 @@ def device_info_receiver_fixture():
         video_mode="Auto",
         video_stretch_type="Fit",
         video_timing="1080p60",
-        audio=None,
-        sinkpower=None,
-        # Transmitter fields (None for receivers)
-        audio_input_type=None,
-        analog_audio_direction=None,
-        bandwidth_adjust_mode=None,
-        bit_perpixel=None,
-        color_space=None,
-        stream0_enable=None,
-        stream0fps_by2_enable=None,
-        stream1_enable=None,
-        stream1_scale=None,
-        stream1fps_by2_enable=None,
-        video_input=None,
-        video_source=None,
-        # Unused/optional fields set to None
-        cbr_avg_bitrate=None,
-        enc_fps=None,
-        enc_gop=None,
-        enc_rc_mode=None,
-        fixqp_iqp=None,
-        fixqp_pqp=None,
-        profile=None,
-        transport_type=None,
-        vbr_max_bitrate=None,
-        vbr_max_qp=None,
-        vbr_min_qp=None,
-        km_over_ip_enable=None,
-        videodetection=None,
-        serial_param=None,
-        temperature=None,
-        genlock_scaling_resolution=None,
     )
 
 
 @pytest.fixture
+def device_info_receiver_fixture():
+    """DeviceInfo for a receiver with complete device information. Rebuilt per test since tests mutate it."""
+    return _device_info_receiver()
+
+
+@pytest.fixture(scope="session")
 def device_info_transmitter_fixture():
     """DeviceInfo for a transmitter with complete device information."""
-    return DeviceInfo(
+    return replace(
+        _DEVICE_INFO_BASE,
         aliasname="Apple TV",
         name="NHD-200-TX-01",
         # Common device information fields
@@ -218,32 +298,6 @@ def device_info_transmitter_fixture():
         stream1fps_by2_enable=False,
         video_input=True,
         video_source="HDMI",
-        # Receiver fields (None for transmitters)
-        sourcein=None,
-        analog_audio_source=None,
-        hdmi_audio_source=None,
-        video_mode=None,
-        video_stretch_type=None,
-        video_timing=None,
-        audio=None,
-        sinkpower=None,
-        # Unused/optional fields set to None
-        cbr_avg_bitrate=None,
-        enc_fps=None,
-        enc_gop=None,
-        enc_rc_mode=None,
-        fixqp_iqp=None,
-        fixqp_pqp=None,
-        profile=None,
-        transport_type=None,
-        vbr_max_bitrate=None,
-        vbr_max_qp=None,
-        vbr_min_qp=None,
-        km_over_ip_enable=None,
-        videodetection=None,
-        serial_param=None,
-        temperature=None,
-        genlock_scaling_resolution=None,
     )
 
 
@@ -253,8 +307,7 @@ def device_info_transmitter_fixture():
 # Fixtures for DeviceController model testing
 
 
-@pytest.fixture
-def device_controller_fixture():
+def _device_controller():
     """Standard DeviceController for most test scenarios."""
     return DeviceController(
         api_version="1.0.0",
@@ -267,6 +320,19 @@ def device_controller_fixture():
 
 
 @pytest.fixture
+def device_controller_fixture():
+    """Standard DeviceController for most test scenarios. Rebuilt per test since tests mutate it."""
+    return _device_controller()
+
+
+@pytest.fixture(scope="session")
+def device_controller_strings_fixture():
+    """(str, repr) of the standard DeviceController, formatted once per session."""
+    controller = _device_controller()
+    return str(controller), repr(controller)
+
+
+@pytest.fixture(scope="session")
 def device_controller_alternative_fixture():
     """Alternative DeviceController for comparison tests."""
     return DeviceController(
@@ -279,29 +345,35 @@ def device_controller_alternative_fixture():
     )
 
 
-@pytest.fixture(
-    params=[
+# (controller, expected_display_name) pairs built once at import for the parametrized fixture below
+_DISPLAY_NAME_CASES = tuple(
+    (
+        DeviceController(
+            api_version="1.0.0",
+            web_version="2.1.0",
+            core_version="3.0.1",
+            ip4addr=ip_addr,
+            netmask="255.255.255.0",
+            gateway="192.168.1.1",
+        ),
+        expected_name,
+    )
+    for ip_addr, expected_name in (
         ("192.168.1.100", "Controller - 192.168.1.100"),
         ("10.0.0.1", "Controller - 10.0.0.1"),
         ("172.16.0.254", "Controller - 172.16.0.254"),
-    ]
+    )
 )
+
+
+@pytest.fixture(scope="session", params=_DISPLAY_NAME_CASES, ids=[case[1] for case in _DISPLAY_NAME_CASES])
 def device_controller_display_name_test_cases(request):
     """Parametrized fixture for testing DeviceController display names with different IPs.
 
     Returns:
         tuple: (DeviceController instance, expected_display_name)
     """
-    ip_addr, expected_name = request.param
-    controller = DeviceController(
-        api_version="1.0.0",
-        web_version="2.1.0",
-        core_version="3.0.1",
-        ip4addr=ip_addr,
-        netmask="255.255.255.0",
-        gateway="192.168.1.1",
-    )
-    return controller, expected_name
+    return request.param
 
 
 # =============================================================================
@@ -313,95 +385,77 @@ def device_controller_display_name_test_cases(request):
 @pytest.fixture
 def device_receiver_fixture():
     """Standard DeviceReceiver for testing receiver functionality."""
-    return DeviceReceiver(
+    return _rx(
         alias_name="Living Room RX",
         true_name="NHD-200-RX-01",
-        device_type="Receiver",
         ip="192.168.1.101",
-        online=True,
-        sequence=1,
         mac="AA:BB:CC:DD:EE:01",
         gateway="192.168.1.1",
-        netmask="255.255.255.0",
         version="1.2.3",
         edid="Custom EDID",
-        ip_mode="static",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_receiver_bedroom_fixture():
     """Secondary DeviceReceiver for multi-device testing."""
-    return DeviceReceiver(
+    return _rx(
         alias_name="Bedroom RX",
         true_name="NHD-200-RX-02",
-        device_type="Receiver",
         ip="192.168.1.103",
-        online=True,
         sequence=3,
         mac="AA:BB:CC:DD:EE:03",
         gateway="192.168.1.1",
-        netmask="255.255.255.0",
         version="1.2.3",
         edid="Custom EDID",
-        ip_mode="static",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_receiver_updated_fixture():
     """DeviceReceiver for testing updates - modified version of standard receiver."""
-    return DeviceReceiver(
+    return _rx(
         alias_name="Updated Living Room RX",
         true_name="NHD-200-RX-01",  # Same as device_receiver_fixture
-        device_type="Receiver",
         ip="192.168.1.201",  # Different IP
         online=False,  # Different online status
-        sequence=1,
         mac="AA:BB:CC:DD:EE:01",
         gateway="192.168.1.1",
-        netmask="255.255.255.0",
         version="1.2.3",
         edid="Custom EDID",
-        ip_mode="static",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_receiver_minimal_fixture():
     """Minimal DeviceReceiver with required fields only."""
-    return DeviceReceiver(
+    return _rx(
         alias_name="Minimal RX",
         true_name="MIN-RX-01",
-        device_type="Receiver",
         ip="10.0.0.100",
         online=False,
         sequence=5,
         mac="11:22:33:44:55:66",
         gateway="10.0.0.1",
-        netmask="255.255.255.0",
         version="2.0.0",
         edid="Minimal EDID",
         ip_mode="dhcp",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_receiver_full_fixture():
     """DeviceReceiver with all optional fields populated."""
-    return DeviceReceiver(
+    return _rx(
         alias_name="Full RX",
         true_name="FULL-RX-01",
-        device_type="Receiver",
         ip="172.16.0.50",
-        online=True,
         sequence=10,
         mac="AA:BB:CC:DD:EE:FF",
         gateway="172.16.0.1",
         netmask="255.255.0.0",
         version="3.1.0",
         edid="Full EDID",
-        ip_mode="static",
         # Optional RX fields
         tx_name="Source TX",
         hdmi_out_active=True,
@@ -413,60 +467,53 @@ def device_receiver_full_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_receiver_no_alias_fixture():
     """DeviceReceiver with empty alias for display name fallback testing."""
-    return DeviceReceiver(
+    return _rx(
         alias_name="",  # Empty alias
         true_name="NO-ALIAS-RX-01",
-        device_type="Receiver",
         ip="192.168.0.200",
-        online=True,
-        sequence=1,
         mac="AA:BB:CC:DD:EE:FF",
         gateway="192.168.0.1",
-        netmask="255.255.255.0",
         version="1.0.0",
         edid="Test EDID",
-        ip_mode="static",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_receiver_no_ip_fixture():
     """DeviceReceiver with empty IP for display name fallback testing."""
-    return DeviceReceiver(
+    return _rx(
         alias_name="",  # Empty alias
         true_name="NO-IP-RX-01",
-        device_type="Receiver",
         ip="",  # Empty IP
-        online=True,
-        sequence=1,
         mac="AA:BB:CC:DD:EE:FF",
         gateway="192.168.0.1",
-        netmask="255.255.255.0",
         version="1.0.0",
         edid="Test EDID",
-        ip_mode="static",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_receiver_for_equality_fixture():
     """DeviceReceiver specifically for equality testing."""
-    return DeviceReceiver(
+    return _rx(
         alias_name="Test RX",
         true_name="TEST-RX-01",
-        device_type="Receiver",
         ip="192.168.1.100",
-        online=True,
-        sequence=1,
         mac="AA:BB:CC:DD:EE:FF",
         gateway="192.168.1.1",
-        netmask="255.255.255.0",
         version="1.0.0",
         edid="Test EDID",
-        ip_mode="static",
+    )
+
+
+@pytest.fixture(scope="session")
+def device_receiver_from_models_fixture():
+    """DeviceReceiver built once by the factory from the standard receiver API models."""
+    return create_device_from_wyrestorm_models(
+        _device_json_receiver(), _device_status_receiver(), _device_info_receiver()
     )
 
 
@@ -479,48 +526,40 @@ def device_receiver_for_equality_fixture():
 @pytest.fixture
 def device_transmitter_fixture():
     """Standard DeviceTransmitter for testing transmitter functionality."""
-    return DeviceTransmitter(
+    return _tx(
         alias_name="Apple TV",
         true_name="NHD-200-TX-01",
-        device_type="Transmitter",
         ip="192.168.1.102",
-        online=True,
         sequence=2,
         mac="AA:BB:CC:DD:EE:02",
         gateway="192.168.1.1",
-        netmask="255.255.255.0",
         version="1.2.3",
         edid="Default EDID",
         ip_mode="dhcp",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_transmitter_minimal_fixture():
     """Minimal DeviceTransmitter with required fields only."""
-    return DeviceTransmitter(
+    return _tx(
         alias_name="Minimal TX",
         true_name="MIN-TX-01",
-        device_type="Transmitter",
         ip="10.0.0.101",
-        online=True,
         sequence=3,
         mac="66:55:44:33:22:11",
         gateway="10.0.0.1",
-        netmask="255.255.255.0",
         version="2.1.0",
         edid="Minimal TX EDID",
-        ip_mode="static",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_transmitter_full_fixture():
     """DeviceTransmitter with all optional fields populated."""
-    return DeviceTransmitter(
+    return _tx(
         alias_name="Full TX",
         true_name="FULL-TX-01",
-        device_type="Transmitter",
         ip="172.16.0.52",
         online=False,
         sequence=15,
@@ -542,22 +581,27 @@ def device_transmitter_full_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_transmitter_for_equality_fixture():
     """DeviceTransmitter specifically for equality testing."""
-    return DeviceTransmitter(
+    return _tx(
         alias_name="Test TX",
         true_name="TEST-TX-01",
-        device_type="Transmitter",
         ip="192.168.1.100",
-        online=True,
-        sequence=1,
         mac="AA:BB:CC:DD:EE:FF",
         gateway="192.168.1.1",
-        netmask="255.255.255.0",
         version="1.0.0",
         edid="Test EDID",
-        ip_mode="static",
+    )
+
+
+@pytest.fixture(scope="session")
+def device_transmitter_from_models_fixture(
+    device_json_transmitter_fixture, device_status_transmitter_fixture, device_info_transmitter_fixture
+):
+    """DeviceTransmitter built once by the factory from the standard transmitter API models."""
+    return create_device_from_wyrestorm_models(
+        device_json_transmitter_fixture, device_status_transmitter_fixture, device_info_transmitter_fixture
     )
 
 
@@ -579,13 +623,13 @@ def coordinator_data_fixture(device_controller_fixture):
 # Fixtures for testing matrix routing assignments
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def single_matrix_assignment_fixture():
     """Matrix with a single assignment for basic testing."""
     return Matrix(assignments=[MatrixAssignment(rx="Living Room RX", tx="Apple TV")])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_matrix_assignments_fixture():
     """Matrix with multiple assignments for comprehensive testing."""
     return Matrix(
@@ -597,7 +641,18 @@ def multiple_matrix_assignments_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def rerouted_matrix_fixture():
+    """Matrix after routing Apple TV to the bedroom as well as the living room."""
+    return Matrix(
+        assignments=[
+            MatrixAssignment(rx="Living Room RX", tx="Apple TV"),
+            MatrixAssignment(rx="Bedroom RX", tx="Apple TV"),
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
 def matrix_with_none_values_fixture():
     """Matrix with None values for edge case testing."""
     return Matrix(
@@ -609,7 +664,7 @@ def matrix_with_none_values_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def matrix_with_empty_strings_fixture():
     """Matrix with empty strings for edge case testing."""
     return Matrix(
@@ -622,7 +677,7 @@ def matrix_with_empty_strings_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def matrix_duplicate_receivers_fixture():
     """Matrix with duplicate receivers for testing override behavior."""
     return Matrix(
@@ -633,7 +688,7 @@ def matrix_duplicate_receivers_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def matrix_mixed_valid_invalid_fixture():
     """Matrix with mixed valid and invalid assignments for comprehensive testing."""
     return Matrix(
@@ -649,7 +704,7 @@ def matrix_mixed_valid_invalid_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def partial_connection_matrix_fixture():
     """Matrix with partial device connections for integration testing."""
     return Matrix(
@@ -666,14 +721,14 @@ def partial_connection_matrix_fixture():
 # Fixtures for integration testing scenarios with multiple devices
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_device_system_json_fixtures():
     """Collection of DeviceJsonString objects for integration testing."""
-    return [
+    return (
         DeviceJsonString(
             aliasName="Living Room RX",
             deviceType="Receiver",
-            group=[DeviceJsonStringGroup(name="ungrouped", sequence=1)],
+            group=[_UNGROUPED_GROUPS[1]],
             ip="192.168.1.101",
             online=True,
             sequence=1,
@@ -682,7 +737,7 @@ def multi_device_system_json_fixtures():
         DeviceJsonString(
             aliasName="Bedroom RX",
             deviceType="Receiver",
-            group=[DeviceJsonStringGroup(name="ungrouped", sequence=2)],
+            group=[_UNGROUPED_GROUPS[2]],
             ip="192.168.1.102",
             online=True,
             sequence=2,
@@ -691,30 +746,30 @@ def multi_device_system_json_fixtures():
         DeviceJsonString(
             aliasName="Apple TV",
             deviceType="Transmitter",
-            group=[DeviceJsonStringGroup(name="ungrouped", sequence=3)],
+            group=[_UNGROUPED_GROUPS[3]],
             ip="192.168.1.201",
             online=True,
             sequence=3,
             trueName="TX-01",
             nameoverlay=True,
         ),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_device_system_status_fixtures():
     """Collection of DeviceStatus objects for integration testing."""
-    return [
+    return (
         DeviceStatus(aliasname="Living Room RX", name="RX-01"),
         DeviceStatus(aliasname="Bedroom RX", name="RX-02"),
         DeviceStatus(aliasname="Apple TV", name="TX-01"),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_device_system_info_fixtures():
     """Collection of DeviceInfo objects for integration testing."""
-    return [
+    return (
         DeviceInfo(
             aliasname="Living Room RX",
             name="RX-01",
@@ -742,7 +797,7 @@ def multi_device_system_info_fixtures():
             netmask="255.255.255.0",
             version="1.0.0",
         ),
-    ]
+    )
 
 
 # =============================================================================
@@ -751,13 +806,13 @@ def multi_device_system_info_fixtures():
 # Fixtures for testing error conditions and boundary cases
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_json_incomplete_fixture():
     """DeviceJsonString for testing incomplete device scenarios."""
     return DeviceJsonString(
         aliasName="Incomplete Device",
         deviceType="Receiver",
-        group=[DeviceJsonStringGroup(name="ungrouped", sequence=1)],
+        group=[_UNGROUPED_GROUPS[1]],
         ip="192.168.1.1",
         online=True,
         sequence=1,
@@ -765,13 +820,13 @@ def device_json_incomplete_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_json_complete_fixture():
     """DeviceJsonString for testing complete device scenarios."""
     return DeviceJsonString(
         aliasName="Complete Device",
         deviceType="Receiver",
-        group=[DeviceJsonStringGroup(name="ungrouped", sequence=1)],
+        group=[_UNGROUPED_GROUPS[1]],
         ip="192.168.1.1",
         online=True,
         sequence=1,
@@ -779,7 +834,7 @@ def device_json_complete_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_status_complete_fixture():
     """DeviceStatus for testing complete device scenarios."""
     return DeviceStatus(
@@ -788,7 +843,7 @@ def device_status_complete_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_info_complete_fixture():
     """DeviceInfo for testing complete device scenarios."""
     return DeviceInfo(
@@ -802,13 +857,13 @@ def device_info_complete_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_json_orphan_fixture():
     """DeviceJsonString for testing orphan device scenarios."""
     return DeviceJsonString(
         aliasName="Orphan Device",
         deviceType="Transmitter",
-        group=[DeviceJsonStringGroup(name="ungrouped", sequence=2)],
+        group=[_UNGROUPED_GROUPS[2]],
         ip="192.168.1.2",
         online=True,
         sequence=2,
@@ -816,13 +871,13 @@ def device_json_orphan_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_json_invalid_type_fixture():
     """DeviceJsonString with invalid device type for testing error handling."""
     return DeviceJsonString(
         aliasName="Invalid Device",
         deviceType="InvalidType",  # Invalid device type
-        group=[DeviceJsonStringGroup(name="ungrouped", sequence=1)],
+        group=[_UNGROUPED_GROUPS[1]],
         ip="192.168.1.1",
         online=True,
         sequence=1,
@@ -830,7 +885,7 @@ def device_json_invalid_type_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_status_invalid_fixture():
     """DeviceStatus for invalid device testing."""
     return DeviceStatus(
@@ -839,7 +894,7 @@ def device_status_invalid_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def device_info_invalid_fixture():
     """DeviceInfo for invalid device testing."""
     return DeviceInfo(
@@ -851,3 +906,56 @@ def device_info_invalid_fixture():
         netmask="255.255.255.0",
         version="1.0.0",
     )
+
+
+# =============================================================================
+# WYRESTORM COORDINATOR FIXTURES
+# =============================================================================
+# Fixtures for WyreStormCoordinator testing against a mocked NetworkHD API
+
+
+@pytest.fixture
+def config_entry_fixture():
+    """Config entry with the factory default connection settings."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="WyreStorm NetworkHD (192.168.1.10)",
+        data={CONF_HOST: "192.168.1.10", CONF_USERNAME: "wyrestorm", CONF_PASSWORD: "networkhd"},
+    )
+
+
+@pytest.fixture
+async def coordinator_fixture(
+    hass,
+    config_entry_fixture,
+    version_fixture,
+    ip_setting_fixture,
+    multi_device_system_json_fixtures,
+    multi_device_system_status_fixtures,
+    multi_device_system_info_fixtures,
+    single_matrix_assignment_fixture,
+):
+    """WyreStormCoordinator whose SSH client and API are mocks serving the multi-device system.
+
+    The API is an AsyncMock, so tests can inspect or override any query or command.
+    """
+    config_entry_fixture.add_to_hass(hass)
+    with (
+        patch("custom_components.wyrestorm_networkhd.coordinator.NetworkHDClientSSH"),
+        patch("custom_components.wyrestorm_networkhd.coordinator.NHDAPI"),
+    ):
+        coordinator = WyreStormCoordinator(hass, config_entry_fixture)
+
+    coordinator.client.is_connected.return_value = False
+    coordinator.api = AsyncMock()
+    api_query = coordinator.api.api_query
+    api_query.config_get_version.return_value = version_fixture
+    api_query.config_get_ipsetting.return_value = ip_setting_fixture
+    api_query.config_get_devicejsonstring.return_value = list(multi_device_system_json_fixtures)
+    api_query.config_get_device_status.return_value = list(multi_device_system_status_fixtures)
+    api_query.config_get_device_info.return_value = list(multi_device_system_info_fixtures)
+    api_query.matrix_get.return_value = single_matrix_assignment_fixture
+
+    yield coordinator
+
+    await coordinator.async_shutdown()
@@ -1,6 +1,6 @@
-# ruff: noqa: F811
 """Comprehensive unit tests for CoordinatorData model."""
 
+from collections.abc import ValuesView
 from datetime import datetime
 from unittest.mock import patch
 
@@ -8,15 +8,6 @@ import pytest
 
 from custom_components.wyrestorm_networkhd.models.coordinator import CoordinatorData
 
-from .._fixtures import (  # noqa: F401
-    coordinator_data_fixture,
-    device_controller_fixture,
-    device_receiver_bedroom_fixture,
-    device_receiver_fixture,
-    device_receiver_updated_fixture,
-    device_transmitter_fixture,
-)
-
 
 class TestCoordinatorData:
     """Comprehensive test suite for CoordinatorData model."""
@@ -31,30 +22,30 @@ class TestCoordinatorData:
         assert coordinator_data.matrix_assignments == {}
         assert isinstance(coordinator_data.last_update, datetime)
 
-    @patch("custom_components.wyrestorm_networkhd.models.coordinator.datetime")
-    def test_post_init_updates_timestamp(self, mock_datetime, device_controller_fixture):
+    @patch("custom_components.wyrestorm_networkhd.models.coordinator.time")
+    def test_post_init_updates_timestamp(self, mock_time, device_controller_fixture):
         """Test that __post_init__ updates the timestamp."""
         mock_now = datetime(2023, 1, 1, 12, 0, 0)
-        mock_datetime.now.return_value = mock_now
+        mock_time.time_ns.return_value = int(mock_now.timestamp()) * 1_000_000_000
 
         coordinator_data = CoordinatorData(device_controller=device_controller_fixture)
 
         assert coordinator_data.last_update == mock_now
-        mock_datetime.now.assert_called_once()
+        mock_time.time_ns.assert_called_once()
 
     def test_get_transmitters_list_empty(self, coordinator_data_fixture):
         """Test get_transmitters_list when no transmitters exist."""
         result = coordinator_data_fixture.get_transmitters_list()
 
-        assert result == []
-        assert isinstance(result, list)
+        assert list(result) == []
+        assert isinstance(result, ValuesView)
 
     def test_get_receivers_list_empty(self, coordinator_data_fixture):
         """Test get_receivers_list when no receivers exist."""
         result = coordinator_data_fixture.get_receivers_list()
 
-        assert result == []
-        assert isinstance(result, list)
+        assert list(result) == []
+        assert isinstance(result, ValuesView)
 
     def test_update_device_add_receiver(self, coordinator_data_fixture, device_receiver_fixture):
         """Test adding a new receiver with update_device."""
@@ -98,16 +89,16 @@ class TestCoordinatorData:
         assert coordinator_data_fixture.device_receivers[device_receiver_fixture.true_name].ip == "192.168.1.201"
         assert coordinator_data_fixture.device_receivers[device_receiver_fixture.true_name].online is False
 
-    @patch("custom_components.wyrestorm_networkhd.models.coordinator.datetime")
-    def test_update_device_updates_timestamp(self, mock_datetime, coordinator_data_fixture, device_receiver_fixture):
+    @patch("custom_components.wyrestorm_networkhd.models.coordinator.time")
+    def test_update_device_updates_timestamp(self, mock_time, coordinator_data_fixture, device_receiver_fixture):
         """Test that update_device updates the timestamp."""
         mock_now = datetime(2023, 1, 1, 13, 0, 0)
-        mock_datetime.now.return_value = mock_now
+        mock_time.time_ns.return_value = int(mock_now.timestamp()) * 1_000_000_000
 
         coordinator_data_fixture.update_device(device_receiver_fixture)
 
         assert coordinator_data_fixture.last_update == mock_now
-        mock_datetime.now.assert_called()
+        mock_time.time_ns.assert_called()
 
     def test_update_device_invalid_type(self, coordinator_data_fixture):
         """Test update_device with invalid device type."""
@@ -148,9 +139,9 @@ class TestCoordinatorData:
 
         assert was_removed is False
 
-    @patch("custom_components.wyrestorm_networkhd.models.coordinator.datetime")
+    @patch("custom_components.wyrestorm_networkhd.models.coordinator.time")
     def test_remove_device_updates_timestamp_when_successful(
-        self, mock_datetime, coordinator_data_fixture, device_receiver_fixture
+        self, mock_time, coordinator_data_fixture, device_receiver_fixture
     ):
         """Test that remove_device updates timestamp when successful."""
         # Add device first
@@ -158,15 +149,15 @@ class TestCoordinatorData:
 
         # Set up mock for removal
         mock_now = datetime(2023, 1, 1, 14, 0, 0)
-        mock_datetime.now.return_value = mock_now
+        mock_time.time_ns.return_value = int(mock_now.timestamp()) * 1_000_000_000
 
         coordinator_data_fixture.remove_device(device_receiver_fixture.true_name)
 
         assert coordinator_data_fixture.last_update == mock_now
-        mock_datetime.now.assert_called()
+        mock_time.time_ns.assert_called()
 
-    @patch("custom_components.wyrestorm_networkhd.models.coordinator.datetime")
-    def test_remove_device_does_not_update_timestamp_when_not_found(self, mock_datetime, coordinator_data_fixture):
+    @patch("custom_components.wyrestorm_networkhd.models.coordinator.time")
+    def test_remove_device_does_not_update_timestamp_when_not_found(self, mock_time, coordinator_data_fixture):
         """Test that remove_device does not update timestamp when device not found."""
         original_timestamp = coordinator_data_fixture.last_update
 
@@ -174,8 +165,8 @@ class TestCoordinatorData:
 
         # Timestamp should not have been updated
         assert coordinator_data_fixture.last_update == original_timestamp
-        # datetime.now() should not have been called for the removal
-        mock_datetime.now.assert_not_called()
+        # time.time_ns() should not have been called for the removal
+        mock_time.time_ns.assert_not_called()
 
     def test_get_lists_with_devices(
         self, coordinator_data_fixture, device_receiver_fixture, device_transmitter_fixture
@@ -189,9 +180,9 @@ class TestCoordinatorData:
         transmitters = coordinator_data_fixture.get_transmitters_list()
 
         assert len(receivers) == 1
-        assert receivers[0] is device_receiver_fixture
+        assert next(iter(receivers)) is device_receiver_fixture
         assert len(transmitters) == 1
-        assert transmitters[0] is device_transmitter_fixture
+        assert next(iter(transmitters)) is device_transmitter_fixture
 
     def test_multiple_devices_same_type(
         self, coordinator_data_fixture, device_receiver_fixture, device_receiver_bedroom_fixture
@@ -216,6 +207,70 @@ class TestCoordinatorData:
         assert receiver2 in receivers
         assert receiver1 not in receivers
 
+    def test_transmitter_aliases_built_from_init(self, device_controller_fixture, device_transmitter_fixture):
+        """Test that transmitter_aliases is derived from transmitters passed at construction."""
+        coordinator_data = CoordinatorData(
+            device_controller=device_controller_fixture,
+            device_transmitters={device_transmitter_fixture.true_name: device_transmitter_fixture},
+        )
+
+        assert coordinator_data.transmitter_aliases == ["Apple TV"]
+
+    def test_transmitter_aliases_track_update_and_remove(self, coordinator_data_fixture, device_transmitter_fixture):
+        """Test that transmitter_aliases follows update_device and remove_device."""
+        coordinator_data_fixture.update_device(device_transmitter_fixture)
+        assert coordinator_data_fixture.transmitter_aliases == ["Apple TV"]
+        assert coordinator_data_fixture.transmitter_alias_set == frozenset({"Apple TV"})
+
+        # Replacing an existing transmitter keeps its slot
+        device_transmitter_fixture.alias_name = "Renamed TV"
+        coordinator_data_fixture.update_device(device_transmitter_fixture)
+        assert coordinator_data_fixture.transmitter_aliases == ["Renamed TV"]
+        assert coordinator_data_fixture.transmitter_alias_set == frozenset({"Renamed TV"})
+
+        coordinator_data_fixture.remove_device(device_transmitter_fixture.true_name)
+        assert coordinator_data_fixture.transmitter_aliases == []
+        assert coordinator_data_fixture.transmitter_alias_set == frozenset()
+
+    def test_receiver_alias_set_tracks_update_and_remove(self, coordinator_data_fixture, device_receiver_fixture):
+        """Test that receiver_alias_set follows update_device and remove_device."""
+        coordinator_data_fixture.update_device(device_receiver_fixture)
+        assert coordinator_data_fixture.receiver_alias_set == frozenset({device_receiver_fixture.alias_name})
+
+        device_receiver_fixture.alias_name = "Renamed RX"
+        coordinator_data_fixture.update_device(device_receiver_fixture)
+        assert coordinator_data_fixture.receiver_alias_set == frozenset({"Renamed RX"})
+
+        coordinator_data_fixture.remove_device(device_receiver_fixture.true_name)
+        assert coordinator_data_fixture.receiver_alias_set == frozenset()
+
+    def test_device_tuples_cached_until_devices_change(
+        self, coordinator_data_fixture, device_receiver_fixture, device_transmitter_fixture
+    ):
+        """Test that device tuples are reused until a device is added or removed."""
+        coordinator_data_fixture.update_device(device_receiver_fixture)
+        receivers = coordinator_data_fixture.get_receivers_tuple()
+        assert receivers == (device_receiver_fixture,)
+        assert coordinator_data_fixture.get_receivers_tuple() is receivers
+
+        # Adding a transmitter leaves the receiver tuple untouched
+        coordinator_data_fixture.update_device(device_transmitter_fixture)
+        assert coordinator_data_fixture.get_receivers_tuple() is receivers
+        assert coordinator_data_fixture.get_transmitters_tuple() == (device_transmitter_fixture,)
+
+        coordinator_data_fixture.remove_device(device_receiver_fixture.true_name)
+        assert coordinator_data_fixture.get_receivers_tuple() == ()
+
+    def test_version_tracks_device_mutations(self, coordinator_data_fixture, device_receiver_fixture):
+        """Test that the mutation version increases on device updates and removals."""
+        version = coordinator_data_fixture.version
+        coordinator_data_fixture.update_device(device_receiver_fixture)
+        assert coordinator_data_fixture.version > version
+
+        version = coordinator_data_fixture.version
+        coordinator_data_fixture.remove_device(device_receiver_fixture.true_name)
+        assert coordinator_data_fixture.version > version
+
     def test_matrix_assignments_initialization(self, coordinator_data_fixture):
         """Test that matrix_assignments initializes as empty dict."""
         assert coordinator_data_fixture.matrix_assignments == {}
@@ -260,16 +315,16 @@ class TestCoordinatorData:
         assert coordinator_data_fixture.matrix_assignments["Living Room RX"] == "Apple TV"
         assert len(coordinator_data_fixture.matrix_assignments) == 1
 
-    @patch("custom_components.wyrestorm_networkhd.models.coordinator.datetime")
-    def test_update_matrix_assignment_updates_timestamp(self, mock_datetime, coordinator_data_fixture):
+    @patch("custom_components.wyrestorm_networkhd.models.coordinator.time")
+    def test_update_matrix_assignment_updates_timestamp(self, mock_time, coordinator_data_fixture):
         """Test that update_matrix_assignment updates the timestamp."""
         mock_now = datetime(2023, 1, 1, 15, 0, 0)
-        mock_datetime.now.return_value = mock_now
+        mock_time.time_ns.return_value = int(mock_now.timestamp()) * 1_000_000_000
 
         coordinator_data_fixture.update_matrix_assignment("Living Room RX", "Apple TV")
 
         assert coordinator_data_fixture.last_update == mock_now
-        mock_datetime.now.assert_called()
+        mock_time.time_ns.assert_called()
 
     def test_remove_matrix_assignment_existing(self, coordinator_data_fixture):
         """Test removing an existing matrix assignment."""
@@ -291,24 +346,24 @@ class TestCoordinatorData:
         assert was_removed is False
         assert len(coordinator_data_fixture.matrix_assignments) == 0
 
-    @patch("custom_components.wyrestorm_networkhd.models.coordinator.datetime")
-    def test_remove_matrix_assignment_updates_timestamp_when_successful(self, mock_datetime, coordinator_data_fixture):
+    @patch("custom_components.wyrestorm_networkhd.models.coordinator.time")
+    def test_remove_matrix_assignment_updates_timestamp_when_successful(self, mock_time, coordinator_data_fixture):
         """Test that remove_matrix_assignment updates timestamp when successful."""
         # Add assignment first
         coordinator_data_fixture.matrix_assignments["Living Room RX"] = "Apple TV"
 
         # Set up mock for removal
         mock_now = datetime(2023, 1, 1, 16, 0, 0)
-        mock_datetime.now.return_value = mock_now
+        mock_time.time_ns.return_value = int(mock_now.timestamp()) * 1_000_000_000
 
         coordinator_data_fixture.remove_matrix_assignment("Living Room RX")
 
         assert coordinator_data_fixture.last_update == mock_now
-        mock_datetime.now.assert_called()
+        mock_time.time_ns.assert_called()
 
-    @patch("custom_components.wyrestorm_networkhd.models.coordinator.datetime")
+    @patch("custom_components.wyrestorm_networkhd.models.coordinator.time")
     def test_remove_matrix_assignment_does_not_update_timestamp_when_not_found(
-        self, mock_datetime, coordinator_data_fixture
+        self, mock_time, coordinator_data_fixture
     ):
         """Test that remove_matrix_assignment does not update timestamp when assignment not found."""
         original_timestamp = coordinator_data_fixture.last_update
@@ -317,5 +372,5 @@ class TestCoordinatorData:
 
         # Timestamp should not have been updated
         assert coordinator_data_fixture.last_update == original_timestamp
-        # datetime.now() should not have been called for the removal
-        mock_datetime.now.assert_not_called()
+        # time.time_ns() should not have been called for the removal
+        mock_time.time_ns.assert_not_called()
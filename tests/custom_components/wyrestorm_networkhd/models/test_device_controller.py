@@ -1,4 +1,3 @@
-# ruff: noqa: F811
 """Unit tests for the DeviceController model.
 
 This module contains comprehensive tests for the DeviceController class,
@@ -13,93 +12,91 @@ Test Categories:
     - Data Model Properties
 """
 
+from types import MappingProxyType
+
+import pytest
+
 from custom_components.wyrestorm_networkhd.models.device_controller import (
     DeviceController,
 )
 
-from .._fixtures import (  # noqa: F401
-    alternative_ip_setting_fixture,
-    alternative_version_fixture,
-    device_controller_display_name_test_cases,
-    device_controller_fixture,
-    ip_setting_fixture,
-    version_fixture,
+# Matches device_controller_fixture; equality cases override one field at a time
+_BASE_CONTROLLER_KWARGS = MappingProxyType(
+    {
+        "api_version": "1.0.0",
+        "web_version": "2.1.0",
+        "core_version": "3.0.1",
+        "ip4addr": "192.168.1.100",
+        "netmask": "255.255.255.0",
+        "gateway": "192.168.1.1",
+    }
 )
 
 
 class TestDeviceControllerInitialization:
     """Test DeviceController initialization and basic properties."""
 
-    def test_init_with_all_parameters(self, device_controller_fixture):
-        """Verify DeviceController initializes correctly with all parameters.
+    def test_init_sets_all_fields(self, device_controller_fixture):
+        """Verify DeviceController initializes every field, including the non-init defaults.
 
         Tests that all version and network configuration fields are properly
-        set when creating a DeviceController instance.
+        set, and that the manufacturer and model field defaults are
+        "WyreStorm" and "NetworkHD Controller".
         """
-        controller = device_controller_fixture
-
-        # Verify version fields
-        assert controller.api_version == "1.0.0"
-        assert controller.web_version == "2.1.0"
-        assert controller.core_version == "3.0.1"
-
-        # Verify network configuration fields
-        assert controller.ip4addr == "192.168.1.100"
-        assert controller.netmask == "255.255.255.0"
-        assert controller.gateway == "192.168.1.1"
-
-    def test_post_init_sets_manufacturer_and_model(self, device_controller_fixture):
-        """Verify __post_init__ automatically sets manufacturer and model.
-
-        The DeviceController should automatically set manufacturer to "WyreStorm"
-        and model to "NetworkHD Controller" during initialization.
-        """
-        controller = device_controller_fixture
-
-        assert controller.manufacturer == "WyreStorm"
-        assert controller.model == "NetworkHD Controller"
+        expected = {
+            # Version fields
+            "api_version": "1.0.0",
+            "web_version": "2.1.0",
+            "core_version": "3.0.1",
+            # Network configuration fields
+            "ip4addr": "192.168.1.100",
+            "netmask": "255.255.255.0",
+            "gateway": "192.168.1.1",
+            # Non-init field defaults
+            "manufacturer": "WyreStorm",
+            "model": "NetworkHD Controller",
+        }
+
+        assert {attr: getattr(device_controller_fixture, attr) for attr in expected} == expected
 
 
 class TestDeviceControllerFactoryMethods:
     """Test DeviceController factory methods and alternate construction."""
 
-    def test_from_wyrestorm_models_factory_method(self, version_fixture, ip_setting_fixture):
+    @pytest.mark.parametrize(
+        ("version_fixture_name", "ip_setting_fixture_name"),
+        [
+            ("version_fixture", "ip_setting_fixture"),
+            ("alternative_version_fixture", "alternative_ip_setting_fixture"),
+        ],
+        ids=["standard", "alternative"],
+    )
+    def test_from_wyrestorm_models_factory_method(self, request, version_fixture_name, ip_setting_fixture_name):
         """Verify DeviceController can be created from WyreStorm API models.
 
         Tests the factory method that creates a DeviceController from
-        Version and IpSetting objects from the wyrestorm-networkhd package.
+        Version and IpSetting objects from the wyrestorm-networkhd package,
+        for both the standard and alternative configurations.
         """
-        controller = DeviceController.from_wyrestorm_models(version_fixture, ip_setting_fixture)
+        version = request.getfixturevalue(version_fixture_name)
+        ip_setting = request.getfixturevalue(ip_setting_fixture_name)
+
+        controller = DeviceController.from_wyrestorm_models(version, ip_setting)
 
         # Verify version fields are correctly mapped
-        assert controller.api_version == version_fixture.api_version
-        assert controller.web_version == version_fixture.web_version
-        assert controller.core_version == version_fixture.core_version
+        assert controller.api_version == version.api_version
+        assert controller.web_version == version.web_version
+        assert controller.core_version == version.core_version
 
         # Verify IP setting fields are correctly mapped
-        assert controller.ip4addr == ip_setting_fixture.ip4addr
-        assert controller.netmask == ip_setting_fixture.netmask
-        assert controller.gateway == ip_setting_fixture.gateway
+        assert controller.ip4addr == ip_setting.ip4addr
+        assert controller.netmask == ip_setting.netmask
+        assert controller.gateway == ip_setting.gateway
 
-        # Verify post-init fields are set
+        # Verify the non-init field defaults
         assert controller.manufacturer == "WyreStorm"
         assert controller.model == "NetworkHD Controller"
-
-    def test_factory_method_with_alternative_data(self, alternative_version_fixture, alternative_ip_setting_fixture):
-        """Verify factory method handles different configurations correctly.
-
-        Tests that the factory method properly maps fields when given
-        alternative version and network configuration data.
-        """
-        controller = DeviceController.from_wyrestorm_models(alternative_version_fixture, alternative_ip_setting_fixture)
-
-        # Verify alternative data is correctly mapped
-        assert controller.api_version == "2.5.0"
-        assert controller.web_version == "3.2.1"
-        assert controller.core_version == "4.1.2"
-        assert controller.ip4addr == "10.0.0.50"
-        assert controller.netmask == "255.255.0.0"
-        assert controller.gateway == "10.0.0.1"
+        assert controller.get_device_display_name() == f"Controller - {ip_setting.ip4addr}"
 
 
 class TestDeviceControllerDisplayName:
@@ -134,64 +131,49 @@ class TestDeviceControllerEquality:
         assert controller1 == controller2
         # Note: DeviceController is not hashable since it's not a frozen dataclass
 
-    def test_inequality_when_fields_differ(self, device_controller_fixture):
-        """Verify controllers with different fields are not equal.
-
-        Tests that DeviceController inequality works correctly when
-        any field differs between instances.
-        """
-        base_controller = device_controller_fixture
-
-        # Test cases for each field that should trigger inequality
-        field_variations = [
+    @pytest.mark.parametrize(
+        "field_change",
+        [
             {"api_version": "2.0.0"},  # Different API version
             {"web_version": "3.0.0"},  # Different web version
             {"core_version": "4.0.0"},  # Different core version
             {"ip4addr": "192.168.1.101"},  # Different IP address
             {"netmask": "255.255.0.0"},  # Different netmask
             {"gateway": "192.168.1.2"},  # Different gateway
-        ]
-
-        for field_change in field_variations:
-            # Create controller with one field different
-            controller_data = {
-                "api_version": "1.0.0",
-                "web_version": "2.1.0",
-                "core_version": "3.0.1",
-                "ip4addr": "192.168.1.100",
-                "netmask": "255.255.255.0",
-                "gateway": "192.168.1.1",
-            }
-            controller_data.update(field_change)
+        ],
+        ids=lambda field_change: next(iter(field_change)),
+    )
+    def test_inequality_when_fields_differ(self, device_controller_fixture, field_change):
+        """Verify controllers with different fields are not equal.
 
-            different_controller = DeviceController(**controller_data)
-            assert base_controller != different_controller, f"Failed for field change: {field_change}"
+        Tests that DeviceController inequality works correctly when
+        any field differs between instances.
+        """
+        # Create controller with one field different
+        different_controller = DeviceController(**{**_BASE_CONTROLLER_KWARGS, **field_change})
+        assert device_controller_fixture != different_controller
 
 
 class TestDeviceControllerStringRepresentations:
     """Test DeviceController string representation methods."""
 
-    def test_string_representation_contains_key_info(self, device_controller_fixture):
+    def test_string_representation_contains_key_info(self, device_controller_strings_fixture):
         """Verify string representation includes essential information.
 
         Tests that str() output contains the class name and key identifying
         information like the IP address.
         """
-        controller = device_controller_fixture
-
-        str_repr = str(controller)
+        str_repr = device_controller_strings_fixture[0]
         assert "DeviceController" in str_repr
         assert "192.168.1.100" in str_repr
 
-    def test_repr_representation_is_detailed(self, device_controller_fixture):
+    def test_repr_representation_is_detailed(self, device_controller_strings_fixture):
         """Verify repr() provides detailed debugging information.
 
         Tests that repr() output contains enough detail to understand
         the object's state, including field names and values.
         """
-        controller = device_controller_fixture
-
-        repr_str = repr(controller)
+        repr_str = device_controller_strings_fixture[1]
         assert "DeviceController" in repr_str
         assert "api_version='1.0.0'" in repr_str
         assert "ip4addr='192.168.1.100'" in repr_str
@@ -218,6 +200,18 @@ class TestDeviceControllerDataModel:
         controller.manufacturer = "Modified"
         assert controller.manufacturer == "Modified"
 
+    def test_dataclass_uses_slots(self, device_controller_fixture):
+        """Verify DeviceController is slotted and carries no per-instance __dict__.
+
+        Tests that manufacturer and model are part of the slot layout so they
+        remain assignable without falling back to an instance dictionary.
+        """
+        controller = device_controller_fixture
+
+        assert not hasattr(controller, "__dict__")
+        assert "manufacturer" in DeviceController.__slots__
+        assert "model" in DeviceController.__slots__
+
     def test_fixture_provides_valid_instance(self, device_controller_fixture):
         """Verify the test fixture provides a properly configured instance.
 
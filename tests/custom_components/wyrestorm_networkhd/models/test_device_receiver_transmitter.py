@@ -1,6 +1,7 @@
-# ruff: noqa: F811
 """Comprehensive unit tests for DeviceReceiver and DeviceTransmitter models."""
 
+from dataclasses import fields
+
 import pytest
 
 from custom_components.wyrestorm_networkhd.models.device_receiver_transmitter import (
@@ -10,23 +11,62 @@ from custom_components.wyrestorm_networkhd.models.device_receiver_transmitter im
     create_device_from_wyrestorm_models,
 )
 
-from .._fixtures import (  # noqa: F401
-    device_info_receiver_fixture,
-    device_info_transmitter_fixture,
-    device_json_receiver_fixture,
-    device_json_transmitter_fixture,
-    device_receiver_fixture,
-    device_receiver_for_equality_fixture,
-    device_receiver_full_fixture,
-    device_receiver_minimal_fixture,
-    device_receiver_no_alias_fixture,
-    device_receiver_no_ip_fixture,
-    device_status_receiver_fixture,
-    device_status_transmitter_fixture,
-    device_transmitter_for_equality_fixture,
-    device_transmitter_full_fixture,
-    device_transmitter_minimal_fixture,
-)
+# Field values the factory should produce from the standard receiver/transmitter API fixtures
+_EXPECTED_RX_FIELDS = {
+    # Base fields
+    "alias_name": "Living Room RX",
+    "true_name": "NHD-200-RX-01",
+    "device_type": "Receiver",
+    "ip": "192.168.1.101",
+    "online": True,
+    "sequence": 1,
+    # DeviceInfo fields
+    "mac": "AA:BB:CC:DD:EE:01",
+    "gateway": "192.168.1.1",
+    "netmask": "255.255.255.0",
+    "version": "1.2.3",
+    "edid": "Custom EDID",
+    "ip_mode": "static",
+    # Common status fields
+    "line_out_audio_enable": True,
+    "stream_frame_rate": 60,
+    "stream_resolution": "1920x1080",
+    # RX specific fields
+    "tx_name": "Apple TV",
+    "hdmi_out_active": True,
+    "hdmi_out_resolution": "1920x1080",
+    "hdcp_status": "HDCP 2.2",
+    "sourcein": "192.168.1.102",
+    "video_mode": "Auto",
+}
+_EXPECTED_TX_FIELDS = {
+    # Base fields
+    "alias_name": "Apple TV",
+    "true_name": "NHD-200-TX-01",
+    "device_type": "Transmitter",
+    "ip": "192.168.1.102",
+    "online": True,
+    "sequence": 2,
+    # DeviceInfo fields
+    "mac": "AA:BB:CC:DD:EE:02",
+    "gateway": "192.168.1.1",
+    "netmask": "255.255.255.0",
+    "version": "1.2.3",
+    "edid": "Default EDID",
+    "ip_mode": "dhcp",
+    # Common status fields
+    "line_out_audio_enable": False,
+    "stream_frame_rate": 60,
+    "stream_resolution": "1920x1080",
+    # TX specific fields
+    "nameoverlay": True,
+    "hdmi_in_active": True,
+    "resolution": "1920x1080",
+    "video_stream_ip_address": "239.0.0.1",
+    "audio_stream_ip_address": "239.0.0.2",
+    "color_space": "YUV444",
+    "video_source": "HDMI",
+}
 
 
 class TestDeviceBase:
@@ -47,19 +87,20 @@ class TestDeviceBase:
         assert device.manufacturer == "WyreStorm"
         assert device.model == "TEST-RX-01"  # Should use true_name
 
+    def test_devices_use_slots(self, device_receiver_for_equality_fixture, device_transmitter_for_equality_fixture):
+        """Test that device models are slotted and carry no per-instance __dict__."""
+        assert not hasattr(device_receiver_for_equality_fixture, "__dict__")
+        assert not hasattr(device_transmitter_for_equality_fixture, "__dict__")
+
 
 class TestDeviceReceiver:
     """Tests for DeviceReceiver model."""
 
-    def test_init_from_factory_method(
-        self, device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
-    ):
+    def test_init_from_factory_method(self, device_receiver_from_models_fixture):
         """Test initialization of DeviceReceiver using factory method."""
-        receiver = create_device_from_wyrestorm_models(
-            device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
-        )
+        receiver = device_receiver_from_models_fixture
 
-        assert isinstance(receiver, DeviceReceiver)
+        assert type(receiver) is DeviceReceiver
         assert receiver.alias_name == "Living Room RX"
         assert receiver.device_type == "Receiver"
         assert receiver.tx_name == "Apple TV"
@@ -67,13 +108,9 @@ class TestDeviceReceiver:
         assert receiver.manufacturer == "WyreStorm"
         assert receiver.model == "NHD-200-RX-01"
 
-    def test_get_device_display_name(
-        self, device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
-    ):
+    def test_get_device_display_name(self, device_receiver_from_models_fixture):
         """Test get_device_display_name method for receiver."""
-        receiver = create_device_from_wyrestorm_models(
-            device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
-        )
+        receiver = device_receiver_from_models_fixture
 
         assert receiver.get_device_display_name() == "Receiver - Living Room RX"
 
@@ -92,15 +129,11 @@ class TestDeviceReceiver:
 class TestDeviceTransmitter:
     """Tests for DeviceTransmitter model."""
 
-    def test_init_from_factory_method(
-        self, device_json_transmitter_fixture, device_status_transmitter_fixture, device_info_transmitter_fixture
-    ):
+    def test_init_from_factory_method(self, device_transmitter_from_models_fixture):
         """Test initialization of DeviceTransmitter using factory method."""
-        transmitter = create_device_from_wyrestorm_models(
-            device_json_transmitter_fixture, device_status_transmitter_fixture, device_info_transmitter_fixture
-        )
+        transmitter = device_transmitter_from_models_fixture
 
-        assert isinstance(transmitter, DeviceTransmitter)
+        assert type(transmitter) is DeviceTransmitter
         assert transmitter.alias_name == "Apple TV"
         assert transmitter.device_type == "Transmitter"
         assert transmitter.nameoverlay is True
@@ -108,13 +141,9 @@ class TestDeviceTransmitter:
         assert transmitter.manufacturer == "WyreStorm"
         assert transmitter.model == "NHD-200-TX-01"
 
-    def test_get_device_display_name(
-        self, device_json_transmitter_fixture, device_status_transmitter_fixture, device_info_transmitter_fixture
-    ):
+    def test_get_device_display_name(self, device_transmitter_from_models_fixture):
         """Test get_device_display_name method for transmitter."""
-        transmitter = create_device_from_wyrestorm_models(
-            device_json_transmitter_fixture, device_status_transmitter_fixture, device_info_transmitter_fixture
-        )
+        transmitter = device_transmitter_from_models_fixture
 
         assert transmitter.get_device_display_name() == "Transmitter - Apple TV"
 
@@ -122,98 +151,33 @@ class TestDeviceTransmitter:
 class TestCreateDeviceFromWyrestormModels:
     """Tests for create_device_from_wyrestorm_models factory function."""
 
-    def test_create_receiver(
-        self, device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
-    ):
+    def test_create_receiver(self, device_receiver_from_models_fixture):
         """Test creating a DeviceReceiver from wyrestorm models."""
-        device = create_device_from_wyrestorm_models(
-            device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
-        )
+        device = device_receiver_from_models_fixture
 
         # Check it's the right type
-        assert isinstance(device, DeviceReceiver)
-        assert not isinstance(device, DeviceTransmitter)
+        assert type(device) is DeviceReceiver
 
-        # Check base fields
-        assert device.alias_name == "Living Room RX"
-        assert device.true_name == "NHD-200-RX-01"
-        assert device.device_type == "Receiver"
-        assert device.ip == "192.168.1.101"
-        assert device.online is True
-        assert device.sequence == 1
-
-        # Check DeviceInfo fields
-        assert device.mac == "AA:BB:CC:DD:EE:01"
-        assert device.gateway == "192.168.1.1"
-        assert device.netmask == "255.255.255.0"
-        assert device.version == "1.2.3"
-        assert device.edid == "Custom EDID"
-        assert device.ip_mode == "static"
-
-        # Check common status fields
-        assert device.line_out_audio_enable is True
-        assert device.stream_frame_rate == 60
-        assert device.stream_resolution == "1920x1080"
-
-        # Check RX specific fields
-        assert device.tx_name == "Apple TV"
-        assert device.hdmi_out_active is True
-        assert device.hdmi_out_resolution == "1920x1080"
-        assert device.hdcp_status == "HDCP 2.2"
-        assert device.sourcein == "192.168.1.102"
-        assert device.video_mode == "Auto"
+        # Check mapped field values
+        assert {name: getattr(device, name) for name in _EXPECTED_RX_FIELDS} == _EXPECTED_RX_FIELDS
 
         # TX fields should not exist
-        assert not hasattr(device, "nameoverlay")
-        assert not hasattr(device, "hdmi_in_active")
-        assert not hasattr(device, "video_stream_ip_address")
+        assert {field.name for field in fields(device)}.isdisjoint(
+            {"nameoverlay", "hdmi_in_active", "video_stream_ip_address"}
+        )
 
-    def test_create_transmitter(
-        self, device_json_transmitter_fixture, device_status_transmitter_fixture, device_info_transmitter_fixture
-    ):
+    def test_create_transmitter(self, device_transmitter_from_models_fixture):
         """Test creating a DeviceTransmitter from wyrestorm models."""
-        device = create_device_from_wyrestorm_models(
-            device_json_transmitter_fixture, device_status_transmitter_fixture, device_info_transmitter_fixture
-        )
+        device = device_transmitter_from_models_fixture
 
         # Check it's the right type
-        assert isinstance(device, DeviceTransmitter)
-        assert not isinstance(device, DeviceReceiver)
-
-        # Check base fields
-        assert device.alias_name == "Apple TV"
-        assert device.true_name == "NHD-200-TX-01"
-        assert device.device_type == "Transmitter"
-        assert device.ip == "192.168.1.102"
-        assert device.online is True
-        assert device.sequence == 2
-
-        # Check DeviceInfo fields
-        assert device.mac == "AA:BB:CC:DD:EE:02"
-        assert device.gateway == "192.168.1.1"
-        assert device.netmask == "255.255.255.0"
-        assert device.version == "1.2.3"
-        assert device.edid == "Default EDID"
-        assert device.ip_mode == "dhcp"
-
-        # Check common status fields
-        assert device.line_out_audio_enable is False
-        assert device.stream_frame_rate == 60
-        assert device.stream_resolution == "1920x1080"
-
-        # Check TX specific fields
-        assert device.nameoverlay is True
-        assert device.hdmi_in_active is True
-        assert device.resolution == "1920x1080"
-        assert device.video_stream_ip_address == "239.0.0.1"
-        assert device.audio_stream_ip_address == "239.0.0.2"
-        assert device.color_space == "YUV444"
-        assert device.video_source == "HDMI"
+        assert type(device) is DeviceTransmitter
+
+        # Check mapped field values
+        assert {name: getattr(device, name) for name in _EXPECTED_TX_FIELDS} == _EXPECTED_TX_FIELDS
 
         # RX fields should not exist
-        assert not hasattr(device, "tx_name")
-        assert not hasattr(device, "hdmi_out_active")
-        assert not hasattr(device, "sourcein")
+        assert {field.name for field in fields(device)}.isdisjoint({"tx_name", "hdmi_out_active", "sourcein"})
 
     def test_handle_none_values(
         self, device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
@@ -335,25 +299,33 @@ class TestFactoryFunctionEdgeCases:
                 device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
             )
 
-    def test_case_insensitive_device_types(
-        self, device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
-    ):
-        """Test that device types are case insensitive."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("device_type", "expected_class"),
+        [
             ("receiver", DeviceReceiver),
             ("RECEIVER", DeviceReceiver),
             ("Receiver", DeviceReceiver),
             ("transmitter", DeviceTransmitter),
             ("TRANSMITTER", DeviceTransmitter),
             ("Transmitter", DeviceTransmitter),
-        ]
-
-        for device_type, expected_class in test_cases:
-            device_json_receiver_fixture.deviceType = device_type
-            device = create_device_from_wyrestorm_models(
-                device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
-            )
-            assert isinstance(device, expected_class)
+        ],
+    )
+    def test_case_insensitive_device_types(
+        self,
+        device_json_receiver_fixture,
+        device_status_receiver_fixture,
+        device_info_receiver_fixture,
+        device_type,
+        expected_class,
+    ):
+        """Test that device types are case insensitive and normalised."""
+        device_json_receiver_fixture.deviceType = device_type
+        device = create_device_from_wyrestorm_models(
+            device_json_receiver_fixture, device_status_receiver_fixture, device_info_receiver_fixture
+        )
+        assert type(device) is expected_class
+        # Device type is normalised to its canonical title
+        assert device.device_type == device_type.title()
 
 
 class TestDeviceEquality:
@@ -0,0 +1,43 @@
+"""Unit tests for the cache_for_seconds decorator."""
+
+from unittest.mock import AsyncMock
+
+from custom_components.wyrestorm_networkhd._cache_utils import cache_for_seconds
+
+
+class _Client:
+    """Minimal owner of a cached async method."""
+
+    def __init__(self, value):
+        self.fetch = AsyncMock(return_value=value)
+
+    @cache_for_seconds(60)
+    async def get(self):
+        return await self.fetch()
+
+
+class TestCacheForSeconds:
+    """Test the cache_for_seconds decorator."""
+
+    async def test_cache_is_per_instance(self):
+        """Verify a new instance never sees another instance's cached result."""
+        first = _Client("first")
+        assert await first.get() == "first"
+        assert await first.get() == "first"
+        first.fetch.assert_awaited_once()
+
+        # A replacement instance (possibly reusing the same id()) queries afresh
+        del first
+        second = _Client("second")
+        assert await second.get() == "second"
+        second.fetch.assert_awaited_once()
+
+    async def test_clear_cache(self):
+        """Verify clear_cache makes the next call query again."""
+        client = _Client("value")
+        await client.get()
+
+        _Client.get.clear_cache(client)
+        await client.get()
+
+        assert client.fetch.await_count == 2
@@ -0,0 +1,77 @@
+"""Unit tests for the WyreStorm NetworkHD integration setup and services.
+
+Test Categories:
+    - Setup and Unload
+    - Services
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.wyrestorm_networkhd import (
+    _register_services,
+    _unregister_services,
+    async_setup_entry,
+    async_unload_entry,
+)
+from custom_components.wyrestorm_networkhd.const import (
+    ATTR_SOURCE_DEVICE,
+    ATTR_TARGET_DEVICE,
+    DOMAIN,
+    SERVICE_MATRIX_SET,
+    SERVICE_POWER_CONTROL,
+)
+
+# Run in the session loop that the async fixtures (including hass) are created on
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class TestSetupAndUnload:
+    """Test config entry setup and unload with a mocked coordinator."""
+
+    async def test_services_follow_setup_unload_and_resetup(self, hass, config_entry_fixture):
+        """Verify services are registered on setup, removed on unload and registered again on re-setup."""
+        config_entry_fixture.add_to_hass(hass)
+        coordinator = MagicMock(host="192.168.1.10", data=None)
+        coordinator.async_setup = AsyncMock()
+        coordinator.async_shutdown = AsyncMock()
+        coordinator.get_device_count.return_value = 0
+
+        with (
+            patch("custom_components.wyrestorm_networkhd.WyreStormCoordinator", return_value=coordinator),
+            patch.object(hass.config_entries, "async_forward_entry_setups", AsyncMock()),
+            patch.object(hass.config_entries, "async_unload_platforms", AsyncMock(return_value=True)),
+        ):
+            for _ in range(2):
+                assert await async_setup_entry(hass, config_entry_fixture)
+                assert hass.services.has_service(DOMAIN, SERVICE_MATRIX_SET)
+                assert hass.services.has_service(DOMAIN, SERVICE_POWER_CONTROL)
+
+                assert await async_unload_entry(hass, config_entry_fixture)
+                assert not hass.services.has_service(DOMAIN, SERVICE_MATRIX_SET)
+                assert not hass.services.has_service(DOMAIN, SERVICE_POWER_CONTROL)
+
+        assert coordinator.async_shutdown.await_count == 2
+
+
+class TestServices:
+    """Test the domain-wide service handlers."""
+
+    async def test_matrix_set_awaits_matrix_refresh(self, hass):
+        """Verify matrix_set waits for the refreshed routing before the service call returns."""
+        coordinator = AsyncMock()
+        hass.data[DOMAIN] = {"entry_id": coordinator}
+        _register_services(hass)
+
+        try:
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_MATRIX_SET,
+                {ATTR_SOURCE_DEVICE: "Apple TV", ATTR_TARGET_DEVICE: "Bedroom RX"},
+                blocking=True,
+            )
+        finally:
+            _unregister_services(hass)
+
+        coordinator.set_matrix.assert_awaited_once_with("Apple TV", "Bedroom RX", background=False)
@@ -5,22 +5,24 @@ coordinator, including device collection building and matrix assignment processi
 
 Test Categories:
     - Device Collection Building
+    - Device Collection Refresh
     - Matrix Assignment Processing
     - Integration Scenarios
     - Error Handling and Edge Cases
 """
 
+from wyrestorm_networkhd.models.api_query import Matrix, MatrixAssignment
+
 from custom_components.wyrestorm_networkhd._utils_coordinator import (
     build_device_collections,
     process_matrix_assignments,
+    refresh_device_collections,
 )
 from custom_components.wyrestorm_networkhd.models.device_receiver_transmitter import (
     DeviceReceiver,
     DeviceTransmitter,
 )
 
-from ._fixtures import *  # noqa: F403, F401
-
 
 class TestBuildDeviceCollections:
     """Test the build_device_collections utility function.
@@ -206,6 +208,65 @@ class TestBuildDeviceCollections:
         assert receivers == {}
 
 
+class TestRefreshDeviceCollections:
+    """Test the refresh_device_collections utility function.
+
+    This function builds refreshed copies of existing devices from fresh
+    status and info data, leaving the original devices untouched.
+    """
+
+    def test_existing_devices_refreshed_as_copies(
+        self,
+        device_json_receiver_fixture,
+        device_status_receiver_fixture,
+        device_info_receiver_fixture,
+    ):
+        """Verify refreshed devices are new objects and the originals keep their state."""
+        transmitters, receivers = build_device_collections(
+            [device_json_receiver_fixture], [device_status_receiver_fixture], [device_info_receiver_fixture]
+        )
+        original = receivers[device_json_receiver_fixture.trueName]
+
+        device_status_receiver_fixture.hdmi_out_active = False
+        device_status_receiver_fixture.stream_error_count = 7
+
+        refreshed_transmitters, refreshed_receivers = refresh_device_collections(
+            transmitters, receivers, [device_status_receiver_fixture], [device_info_receiver_fixture]
+        )
+
+        refreshed = refreshed_receivers[device_json_receiver_fixture.trueName]
+        assert refreshed_transmitters == {}
+        assert refreshed is not original
+        assert type(refreshed) is DeviceReceiver
+        assert refreshed.hdmi_out_active is False
+        assert refreshed.stream_error_count == 7
+        assert refreshed.alias_name == device_json_receiver_fixture.aliasName
+        assert refreshed.model == original.model
+
+        # The input collection and its device are left untouched
+        assert receivers[device_json_receiver_fixture.trueName] is original
+        assert original.hdmi_out_active is True
+        assert original.stream_error_count == 0
+
+    def test_devices_without_fresh_data_are_dropped(
+        self,
+        device_json_receiver_fixture,
+        device_status_receiver_fixture,
+        device_info_receiver_fixture,
+    ):
+        """Verify devices missing from the fresh status data are excluded."""
+        transmitters, receivers = build_device_collections(
+            [device_json_receiver_fixture], [device_status_receiver_fixture], [device_info_receiver_fixture]
+        )
+
+        refreshed_transmitters, refreshed_receivers = refresh_device_collections(
+            transmitters, receivers, [], [device_info_receiver_fixture]
+        )
+
+        assert refreshed_transmitters == {}
+        assert refreshed_receivers == {}
+
+
 class TestProcessMatrixAssignments:
     """Test the process_matrix_assignments utility function.
 
@@ -361,8 +422,6 @@ class TestIntegrationScenarios:
         transmitters, receivers = build_device_collections(device_json_list, device_status_list, device_info_list)
 
         # Create matrix assignments linking the devices
-        from wyrestorm_networkhd.models.api_query import Matrix, MatrixAssignment
-
         matrix = Matrix(
             assignments=[
                 MatrixAssignment(
@@ -0,0 +1,308 @@
+"""Unit tests for WyreStormCoordinator.
+
+This module tests the coordinator against a mocked NetworkHD API, covering
+the cached controller queries, the full data update, matrix consumers,
+waiting for data, matrix routing and the debounced matrix refresh.
+
+Test Categories:
+    - Cached Queries
+    - Data Update
+    - Matrix Consumers
+    - Waiting for Data
+    - Matrix Routing
+    - Matrix Refresh Debouncing
+"""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.wyrestorm_networkhd.const import MATRIX_REFRESH_COOLDOWN
+
+# Run in the session loop that the async fixtures (including hass) are created on
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def _async_load(coordinator):
+    """Register a matrix consumer, load the first data and reset the recorded API calls."""
+    coordinator.async_add_matrix_consumer()
+    await coordinator.async_refresh()
+    coordinator.api.reset_mock()
+
+
+async def _async_fire_cooldown(hass):
+    """Advance time past the matrix refresh cooldown and let the trailing refresh run."""
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=MATRIX_REFRESH_COOLDOWN))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+class TestCachedQueries:
+    """Test the time-cached controller queries."""
+
+    @pytest.mark.parametrize(
+        ("method_name", "query_name"),
+        [
+            ("_get_cached_version", "config_get_version"),
+            ("_get_cached_ip_settings", "config_get_ipsetting"),
+        ],
+    )
+    async def test_cached_for_15_minutes(self, coordinator_fixture, method_name, query_name):
+        """Verify results are reused for 900 seconds and re-queried afterwards."""
+        method = getattr(coordinator_fixture, method_name)
+        query = getattr(coordinator_fixture.api.api_query, query_name)
+
+        with patch("custom_components.wyrestorm_networkhd._cache_utils.time") as mock_time:
+            mock_time.time.return_value = 1_000.0
+            first = await method()
+
+            mock_time.time.return_value = 1_000.0 + 899
+            assert await method() is first
+            assert query.await_count == 1
+
+            mock_time.time.return_value = 1_000.0 + 900
+            await method()
+            assert query.await_count == 2
+
+
+class TestDataUpdate:
+    """Test the full data update against the mocked API."""
+
+    async def test_queries_run_one_at_a_time(self, coordinator_fixture):
+        """Verify every query is issued in order and none overlap on the SSH session."""
+        api_query = coordinator_fixture.api.api_query
+        coordinator_fixture.async_add_matrix_consumer()
+        in_flight = 0
+        max_in_flight = 0
+
+        def _track(query):
+            result = query.return_value
+
+            async def _query():
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                return result
+
+            query.side_effect = _query
+
+        queries = (
+            "config_get_version",
+            "config_get_ipsetting",
+            "config_get_devicejsonstring",
+            "config_get_device_status",
+            "config_get_device_info",
+            "matrix_get",
+        )
+        for name in queries:
+            _track(getattr(api_query, name))
+
+        await coordinator_fixture._async_update_data()
+
+        assert max_in_flight == 1
+        assert [name for name, _args, _kwargs in api_query.mock_calls] == list(queries)
+
+    async def test_builds_data_from_responses(self, coordinator_fixture, version_fixture, ip_setting_fixture):
+        """Verify the controller, devices and matrix assignments come from the API responses."""
+        coordinator_fixture.async_add_matrix_consumer()
+
+        data = await coordinator_fixture._async_update_data()
+
+        assert data.device_controller.core_version == version_fixture.core_version
+        assert data.device_controller.ip4addr == ip_setting_fixture.ip4addr
+        assert set(data.device_transmitters) == {"TX-01"}
+        assert set(data.device_receivers) == {"RX-01", "RX-02"}
+        assert data.matrix_assignments == {"Living Room RX": "Apple TV"}
+
+    async def test_api_error_raises_update_failed(self, coordinator_fixture):
+        """Verify API errors surface as UpdateFailed."""
+        coordinator_fixture.api.api_query.config_get_device_status.side_effect = ConnectionError("SSH session closed")
+
+        with pytest.raises(UpdateFailed, match="Error communicating with API: SSH session closed"):
+            await coordinator_fixture._async_update_data()
+
+
+class TestMatrixConsumers:
+    """Test that the matrix query follows the registered matrix consumers."""
+
+    async def test_matrix_query_skipped_without_consumers(self, coordinator_fixture):
+        """Verify no matrix query is made before any consumer registers."""
+        await coordinator_fixture.async_refresh()
+
+        coordinator_fixture.api.api_query.matrix_get.assert_not_awaited()
+        assert coordinator_fixture.data.matrix_assignments == {}
+
+    async def test_skipped_query_keeps_previous_assignments(self, coordinator_fixture):
+        """Verify removing the last consumer keeps the last known routing instead of clearing it."""
+        remove_consumer = coordinator_fixture.async_add_matrix_consumer()
+        await coordinator_fixture.async_refresh()
+        remove_consumer()
+        coordinator_fixture.api.reset_mock()
+
+        await coordinator_fixture.async_refresh()
+
+        coordinator_fixture.api.api_query.matrix_get.assert_not_awaited()
+        assert coordinator_fixture.data.matrix_assignments == {"Living Room RX": "Apple TV"}
+
+    async def test_first_consumer_triggers_refresh(self, hass, coordinator_fixture):
+        """Verify only the first consumer fetches assignments ahead of the next poll."""
+        await coordinator_fixture.async_refresh()
+        matrix_get = coordinator_fixture.api.api_query.matrix_get
+
+        coordinator_fixture.async_add_matrix_consumer()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert matrix_get.await_count == 1
+        assert coordinator_fixture.data.matrix_assignments == {"Living Room RX": "Apple TV"}
+
+        coordinator_fixture.async_add_matrix_consumer()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert matrix_get.await_count == 1
+
+    async def test_remove_callback_is_idempotent(self, hass, coordinator_fixture):
+        """Verify removing a consumer twice does not unregister another consumer."""
+        await coordinator_fixture.async_refresh()
+        remove_consumer = coordinator_fixture.async_add_matrix_consumer()
+        coordinator_fixture.async_add_matrix_consumer()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        remove_consumer()
+        remove_consumer()
+        coordinator_fixture.api.reset_mock()
+        await coordinator_fixture.async_refresh()
+
+        # The remaining consumer still needs the matrix
+        coordinator_fixture.api.api_query.matrix_get.assert_awaited_once()
+
+
+class TestWaitForData:
+    """Test wait_for_data on a coordinator that has not loaded data yet."""
+
+    async def test_returns_true_once_data_loads(self, coordinator_fixture):
+        """Verify waiting triggers a refresh and returns True when it succeeds."""
+        assert await coordinator_fixture.wait_for_data(timeout=5) is True
+        assert coordinator_fixture.is_ready()
+
+    async def test_returns_immediately_when_ready(self, coordinator_fixture):
+        """Verify no further refresh is requested once data is available."""
+        await _async_load(coordinator_fixture)
+
+        assert await coordinator_fixture.wait_for_data(timeout=5) is True
+        coordinator_fixture.api.api_query.config_get_devicejsonstring.assert_not_awaited()
+
+    async def test_failed_update_returns_false_without_waiting(self, coordinator_fixture):
+        """Verify a failed update wakes the waiter instead of holding it for the full timeout."""
+        coordinator_fixture.api.api_query.config_get_device_status.side_effect = ConnectionError("SSH session closed")
+
+        async with asyncio.timeout(5):
+            assert await coordinator_fixture.wait_for_data(timeout=30) is False
+
+    async def test_times_out_when_update_hangs(self, coordinator_fixture):
+        """Verify False is returned when no update finishes within the timeout."""
+        coordinator_fixture.api.api_query.config_get_devicejsonstring.side_effect = asyncio.Event().wait
+
+        assert await coordinator_fixture.wait_for_data(timeout=0.05) is False
+        assert not coordinator_fixture.is_ready()
+
+
+class TestMatrixRouting:
+    """Test set_matrix and its follow-up matrix refresh."""
+
+    async def test_foreground_refresh_is_awaited(self, coordinator_fixture, rerouted_matrix_fixture):
+        """Verify background=False returns only after the new routing has been loaded."""
+        await _async_load(coordinator_fixture)
+        coordinator_fixture.api.api_query.matrix_get.return_value = rerouted_matrix_fixture
+
+        await coordinator_fixture.set_matrix("Apple TV", "Bedroom RX", background=False)
+
+        coordinator_fixture.api.media_stream_matrix_switch.matrix_set.assert_awaited_once_with(
+            "Apple TV", ["Bedroom RX"]
+        )
+        coordinator_fixture.api.api_query.matrix_get.assert_awaited_once()
+        assert coordinator_fixture.data.matrix_assignments["Bedroom RX"] == "Apple TV"
+
+    async def test_background_refresh_is_scheduled(
+        self, hass, coordinator_fixture, config_entry_fixture, rerouted_matrix_fixture
+    ):
+        """Verify the default schedules the refresh as an entry background task."""
+        await _async_load(coordinator_fixture)
+        coordinator_fixture.api.api_query.matrix_get.return_value = rerouted_matrix_fixture
+
+        with patch.object(
+            config_entry_fixture,
+            "async_create_background_task",
+            wraps=config_entry_fixture.async_create_background_task,
+        ) as mock_create_task:
+            await coordinator_fixture.set_matrix("Apple TV", "Bedroom RX")
+
+        mock_create_task.assert_called_once()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert coordinator_fixture.data.matrix_assignments["Bedroom RX"] == "Apple TV"
+
+    async def test_unknown_target_raises(self, coordinator_fixture):
+        """Verify routing to an unknown receiver is rejected before any command is sent."""
+        await _async_load(coordinator_fixture)
+
+        with pytest.raises(ValueError, match="Target device 'Garage RX' not found"):
+            await coordinator_fixture.set_matrix("Apple TV", "Garage RX")
+
+        coordinator_fixture.api.media_stream_matrix_switch.matrix_set.assert_not_awaited()
+
+
+class TestMatrixRefreshDebouncing:
+    """Test that routing changes share a debounced matrix refresh."""
+
+    async def test_rapid_set_matrix_collapses_refreshes(self, hass, coordinator_fixture):
+        """Verify a burst of background routing changes queries the matrix once, then once more after the cooldown."""
+        await _async_load(coordinator_fixture)
+        matrix_get = coordinator_fixture.api.api_query.matrix_get
+
+        for _ in range(5):
+            await coordinator_fixture.set_matrix("Apple TV", "Living Room RX")
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        # Leading edge refreshes immediately; the rest of the burst waits for the cooldown
+        assert coordinator_fixture.api.media_stream_matrix_switch.matrix_set.await_count == 5
+        assert matrix_get.await_count == 1
+
+        # Trailing edge picks up the final routing with a single further query
+        await _async_fire_cooldown(hass)
+        assert matrix_get.await_count == 2
+
+    async def test_blocking_calls_bypass_debouncer(
+        self, coordinator_fixture, rerouted_matrix_fixture, single_matrix_assignment_fixture
+    ):
+        """Verify back-to-back blocking calls each return with their own routing loaded."""
+        await _async_load(coordinator_fixture)
+        coordinator_fixture.api.api_query.matrix_get.side_effect = [
+            rerouted_matrix_fixture,
+            single_matrix_assignment_fixture,
+        ]
+
+        await coordinator_fixture.set_matrix("Apple TV", "Bedroom RX", background=False)
+        assert coordinator_fixture.data.matrix_assignments["Bedroom RX"] == "Apple TV"
+
+        # Still inside the debouncer cooldown of the first call
+        await coordinator_fixture.set_matrix(None, "Bedroom RX", background=False)
+        assert "Bedroom RX" not in coordinator_fixture.data.matrix_assignments
+        assert coordinator_fixture.api.api_query.matrix_get.await_count == 2
+
+    async def test_shutdown_cancels_pending_refresh(self, hass, coordinator_fixture):
+        """Verify async_shutdown drops a trailing refresh that has not run yet."""
+        await _async_load(coordinator_fixture)
+        matrix_get = coordinator_fixture.api.api_query.matrix_get
+
+        await coordinator_fixture.set_matrix("Apple TV", "Living Room RX")
+        await coordinator_fixture.set_matrix("Apple TV", "Bedroom RX")
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert matrix_get.await_count == 1
+
+        await coordinator_fixture.async_shutdown()
+        await _async_fire_cooldown(hass)
+
+        assert matrix_get.await_count == 1